@@ -1,8 +1,11 @@
 # SPDX-License-Identifier: MIT
 """Code for interfacing with BotB."""
 
-from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import lxml.html
+from time import monotonic
 from datetime import date as dt_date, datetime
 from functools import cached_property
 from typing import (
@@ -34,12 +37,27 @@ from .types import (
     BotBrStats,
     DailyStats,
 )
-from .utils import Session, param_stringify
+from .utils import Session, json_loads, param_stringify
+
+#: Largest object ID that can plausibly exist server-side; BotB primary keys
+#: are 32-bit integers. Load queries for IDs outside this range short-circuit
+#: to "not found" without a request.
+_MAX_ID = 2**31 - 1
+
+#: Cache of pre-encoded "filters" query strings, keyed by the filter dict's
+#: sorted items; repeat list calls with identical filters skip re-encoding.
+_FILTER_STR_CACHE: Dict[tuple, str] = {}
 
 
 @dataclass
 class Condition:
-    """Represents a condition passed to a "list" API query."""
+    """
+    Represents a condition passed to a "list" API query.
+
+    The query-string fragments for the condition are precomputed on
+    creation; don't modify the fields of an existing Condition, make a
+    new one instead.
+    """
 
     #: Property that the condition applies to.
     property: str
@@ -50,6 +68,35 @@ class Condition:
     #: Operand for the condition.
     operand: Union[int, str, bool, List[Any], Tuple[Any]]
 
+    def __post_init__(self):
+        """
+        Precompute the condition's query fragments.
+
+        ``_list`` only has to prepend its per-query condition index to each
+        key, so conditions reused across many list calls (or pages) are
+        stringified exactly once.
+
+        :raises ValueError: If a list operand is empty.
+        """
+        items = [
+            ("[key]", self.property),
+            ("[property]", self.property),
+            ("[operator]", self.operator),
+        ]
+
+        if isinstance(self.operand, (list, tuple)):
+            if len(self.operand) == 0:
+                raise ValueError("Length of list operand must be more than 0")
+            elif len(self.operand) == 1:
+                items.append(("[operand][]", param_stringify(self.operand[0])))
+            else:
+                for n, operand in enumerate(self.operand):
+                    items.append((f"[operand][{n}]", param_stringify(operand)))
+        else:
+            items.append(("[operand]", param_stringify(self.operand)))
+
+        self._encoded = tuple(items)
+
 
 class PaginatedList:
     """
@@ -60,7 +107,13 @@ class PaginatedList:
     """
 
     def __init__(
-        self, func: Callable, max_items: int = 0, offset: int = 0, *args, **kwargs
+        self,
+        func: Callable,
+        max_items: int = 0,
+        offset: int = 0,
+        prefetch: int = 1,
+        *args,
+        **kwargs,
     ):
         """
         Initialize a paginated iterator.
@@ -69,12 +122,18 @@ class PaginatedList:
             values.
         :param offset: Skip the first N items.
         :param max_items: Maximum amount of items to return; 0 for no limit.
+        :param prefetch: How many pages to keep in flight ahead of the one
+            being consumed. 1 (the default) fetches the next page only once
+            the current one is known to be full; higher values speculatively
+            pipeline further pages and may fetch up to that many pages
+            needlessly if iteration stops early.
         :param args: Arguments to pass to the list function.
         :param kwargs: Keyword arguments to pass to the list function.
         """
         self.func = func
         self.offset = offset
         self.max_items = max_items
+        self.prefetch = max(1, prefetch)
         self.args = args
         self.kwargs = kwargs
         self.max_page_size = 500
@@ -100,31 +159,93 @@ class PaginatedList:
             page = self.offset // page_length
             index = self.offset % page_length
 
-        ret = self.func(
-            *self.args, **self.kwargs, page_number=page, page_length=page_length
-        )
-        while (self.max_items == 0 or (count < self.max_items)) and len(ret) > 0:
-            if index >= len(ret):
-                # If the length of the returned page is less than the max page length,
-                # we've reached the end of the list; no further queries are needed
-                if len(ret) < page_length:
-                    return None
-
-                # If max_items is set and larger than the max page length, make sure
-                # that if we're on the last page we only fetch as many objects as we need
-                if self.max_items > self.max_page_size:
-                    page_length = min((self.max_items - count), self.max_page_size)
-
-                # Load the next page and reset the index
-                page += 1
-                ret = self.func(
-                    *self.args, **self.kwargs, page_number=page, page_length=page_length
-                )
-                index = 0
+        # Up to self.prefetch pages are kept in flight on worker threads
+        # ahead of the one being consumed, so page round-trips overlap with
+        # parsing/consuming. If iteration stops early, at most the pages
+        # already in flight are fetched needlessly.
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            ret = self.func(
+                *self.args, **self.kwargs, page_number=page, page_length=page_length
+            )
+            #: Futures for in-flight pages, with the page length each was
+            #: requested with, in page order.
+            window: deque = deque()
+            # Predicted page/item-count state for the deepest submitted page,
+            # assuming every in-flight page comes back full; a short page
+            # ends iteration anyway, so overprediction is harmless.
+            pred_page = page
+            pred_count = count + (len(ret) - index)
+
+            def top_up():
+                nonlocal pred_page, pred_count
+                while len(window) < self.prefetch:
+                    # Stop if the sequential logic wouldn't need this page:
+                    # max_items is already covered by the pages before it.
+                    if self.max_items and pred_count >= self.max_items:
+                        return
+                    # If max_items is set and larger than the max page
+                    # length, make sure that if we're on the last page we
+                    # only fetch as many objects as we need
+                    if self.max_items > self.max_page_size:
+                        next_length = min(
+                            (self.max_items - pred_count), self.max_page_size
+                        )
+                    else:
+                        next_length = page_length
+                    window.append(
+                        (
+                            executor.submit(
+                                self.func,
+                                *self.args,
+                                **self.kwargs,
+                                page_number=pred_page + 1,
+                                page_length=next_length,
+                            ),
+                            next_length,
+                        )
+                    )
+                    pred_page += 1
+                    pred_count += next_length
+
+            if len(ret) >= page_length:
+                top_up()
+
+            while (self.max_items == 0 or (count < self.max_items)) and len(ret) > 0:
+                if index >= len(ret):
+                    # If the length of the returned page is less than the max
+                    # page length, we've reached the end of the list; no
+                    # further queries are needed
+                    if len(ret) < page_length or not window:
+                        return None
+
+                    # Move to the oldest prefetched page and reset the index
+                    future, page_length = window.popleft()
+                    ret = future.result()
+                    page += 1
+                    index = 0
+                    if len(ret) >= page_length:
+                        top_up()
+                    continue
+
+                yield ret[index]
+                count += 1
+                index += 1
+
+
+def _get_soup(html: str) -> Any:
+    """
+    Parse HTML into a BeautifulSoup object, importing bs4 on first use.
+
+    bs4 (plus soupsieve) is only needed by the handful of site-scraping
+    methods; importing it lazily keeps it off the import path of programs
+    that stick to the JSON API.
+
+    :param html: HTML to parse, as a string.
+    :returns: The resulting BeautifulSoup object.
+    """
+    from bs4 import BeautifulSoup
 
-            yield ret[index]
-            count += 1
-            index += 1
+    return BeautifulSoup(html, "lxml")
 
 
 def parse_tag_cloud(cloud_html: str) -> Dict[str, int]:
@@ -135,17 +256,172 @@ def parse_tag_cloud(cloud_html: str) -> Dict[str, int]:
     :param cloud_html: HTML to parse, as a string.
     :returns: Dictionary with tag as the key and size in pixels as the value.
     """
-    soup = BeautifulSoup(cloud_html, "lxml")
+    # The cloud is a flat list of <a> elements; parse it with lxml directly
+    # instead of paying for BeautifulSoup's tree-building on top of it.
+    tree = lxml.html.fromstring(cloud_html)
 
     out = {}
-    for tag_a in soup.find_all("a"):
-        out[tag_a.text.replace(r"<\/a>", "").strip()] = int(
-            "".join([a for a in tag_a["style"].split("font-size:")[1] if a.isnumeric()])
+    for tag_a in tree.iter("a"):
+        out[tag_a.text_content().replace(r"<\/a>", "").strip()] = int(
+            "".join(
+                [
+                    a
+                    for a in tag_a.get("style").partition("font-size:")[2]
+                    if a.isnumeric()
+                ]
+            )
         )
 
     return out
 
 
+def _make_list_noiter(object_type: str, cls: type) -> Callable:
+    """
+    Generate a ``_<object_type>_list_noiter`` method for the :class:`BotB` class.
+
+    The per-object-type list methods are identical apart from the object type
+    and the dataclass the payloads are unrolled into; generating them from a
+    single template removes a lot of duplicated code and keeps the hot
+    payload-to-dataclass loop in one place.
+
+    :param object_type: Object type string, e.g. "botbr".
+    :param cls: Dataclass to unroll payloads into.
+    :returns: The generated method.
+    """
+    # Bound once here, so the comprehension below loads a plain local on
+    # every row instead of a class attribute chain.
+    from_payload = cls.from_payload
+
+    def _list_noiter(
+        self,
+        page_number: int = 0,
+        page_length: int = 25,
+        desc: bool = False,
+        sort: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        conditions: Optional[List[Condition]] = None,
+    ) -> List[Any]:
+        ret = self._list(
+            object_type,
+            page_number=page_number,
+            page_length=page_length,
+            desc=desc,
+            sort=sort,
+            filters=filters,
+            conditions=conditions,
+        )
+
+        return [from_payload(payload) for payload in ret]
+
+    _list_noiter.__name__ = f"_{object_type}_list_noiter"
+    _list_noiter.__qualname__ = f"BotB.{_list_noiter.__name__}"
+    _list_noiter.__doc__ = f"""
+        Perform a list query against the {object_type} table (non-PaginatedList version).
+
+        For a list of supported filter/condition properties, see :py:class:`.{cls.__name__}`.
+
+        :api: /api/v1/{object_type}/list
+        :param page_number: Number of the list page, for pagination.
+        :param page_length: Length of the list page, for pagination (max. 250).
+        :param desc: If True, returns items in descending order. Requires sort key to be set.
+        :param sort: Object property to sort by.
+        :param filters: Dictionary with object property as the key and filter value
+                        as the value. Note that filters are deprecated; conditions
+                        should be used instead.
+        :param conditions: List of Condition objects containing list conditions.
+        :returns: List of {cls.__name__} objects representing the search results. If the
+                  search returned no results, the list will be empty.
+        :raises ConnectionError: On connection error.
+        :raises ValueError: If a provided parameter is incorrect.
+        """
+
+    return _list_noiter
+
+
+def _make_load_many(object_type: str, cls: type) -> Callable:
+    """
+    Generate a ``<object_type>_load_many`` method for the :class:`BotB` class.
+
+    Loading N objects through the list endpoint with an "id IN (...)"
+    condition costs one request per 500 IDs instead of one per object.
+
+    :param object_type: Object type string, e.g. "botbr".
+    :param cls: Dataclass to unroll payloads into.
+    :returns: The generated method.
+    """
+
+    def _load_many(self, object_ids: List[int]) -> List[Any]:
+        if not object_ids:
+            return []
+
+        noiter = getattr(self, f"_{object_type}_list_noiter")
+        out = []
+        # The list endpoint caps pages at 500 entries; chunk larger batches.
+        for i in range(0, len(object_ids), 500):
+            chunk = object_ids[i : i + 500]
+            out += noiter(
+                sort="id",
+                conditions=[Condition("id", "IN", chunk)],
+                page_length=len(chunk),
+            )
+        return out
+
+    _load_many.__name__ = f"{object_type}_load_many"
+    _load_many.__qualname__ = f"BotB.{_load_many.__name__}"
+    _load_many.__doc__ = f"""
+        Load multiple {object_type} objects by their IDs with a single list
+        query per 500 IDs, instead of one load call per object.
+
+        :api: /api/v1/{object_type}/list
+        :param object_ids: IDs of the objects to load.
+        :returns: List of {cls.__name__} objects, sorted by ID (not by the
+                  order of the input list); IDs that don't exist are simply
+                  absent from the result.
+        :raises ConnectionError: On connection error.
+        """
+
+    return _load_many
+
+
+def _make_search_noiter(object_type: str, cls: type) -> Callable:
+    """
+    Generate a ``_<object_type>_search_noiter`` method for the :class:`BotB` class.
+
+    See :func:`._make_list_noiter` for rationale.
+
+    :param object_type: Object type string, e.g. "botbr".
+    :param cls: Dataclass to unroll payloads into.
+    :returns: The generated method.
+    """
+    from_payload = cls.from_payload
+
+    def _search_noiter(
+        self, query: str, page_number: int = 0, page_length: int = 25
+    ) -> List[Any]:
+        ret = self._search(
+            object_type, query, page_number=page_number, page_length=page_length
+        )
+
+        return [from_payload(payload) for payload in ret]
+
+    _search_noiter.__name__ = f"_{object_type}_search_noiter"
+    _search_noiter.__qualname__ = f"BotB.{_search_noiter.__name__}"
+    _search_noiter.__doc__ = f"""
+        Search for {object_type} objects that match the given query
+        (non-PaginatedList version).
+
+        :api: /api/v1/{object_type}/search
+        :param query: Search query for the search.
+        :param page_number: Number of the list page, for pagination.
+        :param page_length: Length of the list page, for pagination (max. 250).
+        :returns: List of {cls.__name__} objects representing the search results. If the
+            search returned no results, the list will be empty.
+        :raises ConnectionError: On connection error.
+        """
+
+    return _search_noiter
+
+
 class BotB:
     """
     BotB API class.
@@ -154,18 +430,44 @@ class BotB:
     Lyceum (https://battleofthebits.com/lyceum/View/BotB+API+v1).
     """
 
-    def __init__(self, app_name: Optional[str] = None):
+    def __init__(self, app_name: Optional[str] = None, cache_ttl: int = 0):
         """
         Initialize the BotB API access object.
 
         :param app_name: App name to be used in the user agent for requests; see
             `:attr:.app_name`.
+        :param cache_ttl: How long load results may be served from an in-memory
+            cache, in seconds. 0 (the default) disables caching; repeat loads
+            of the same object always hit the network.
         """
         #: Internal Session object.
         self._s = Session()
+        #: TTL for the opt-in load cache, in seconds; see the cache_ttl
+        #: init parameter.
+        self.cache_ttl = cache_ttl
+        #: Cached load payloads, keyed by (object_type, object_id); the value
+        #: holds the fetch time, the payload (None for a 404) and the
+        #: response's ETag (None if the server didn't send one).
+        self._load_cache: Dict[
+            Tuple[str, int], Tuple[float, Union[dict, None], Union[str, None]]
+        ] = {}
         if app_name:
             self.app_name = app_name
 
+    def close(self):
+        """
+        Close the underlying HTTP session and its connection pool.
+
+        The object is unusable afterwards; create a new one if needed.
+        """
+        self._s.close()
+
+    def __enter__(self) -> "BotB":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     @property
     def app_name(self) -> str:
         """
@@ -197,20 +499,60 @@ class BotB:
         :returns: A dictionary containing the JSON result, or None if not found.
         :raises ConnectionError: On connection error.
         """
+        if not 0 < object_id <= _MAX_ID:
+            # An ID outside the plausible key range can't exist; skip the
+            # round-trip (the API would return a 404 anyway).
+            return None
+
+        cached = None
+        headers = None
+        if self.cache_ttl > 0:
+            cached = self._load_cache.get((object_type, object_id))
+            if cached is not None:
+                if (monotonic() - cached[0]) < self.cache_ttl:
+                    # Return a copy; from_payload callers may modify the dict.
+                    return dict(cached[1]) if cached[1] is not None else None
+                if cached[2] is not None:
+                    # Expired, but we have an ETag; revalidate with a
+                    # conditional GET. A 304 costs a round-trip but no body
+                    # transfer or JSON parse.
+                    headers = {"If-None-Match": cached[2]}
+
         ret = self._s.get(
             f"https://battleofthebits.com/api/v1/{object_type}/load/{object_id}",
             handle_notfound=True,
-        )
-        if ret.status_code == 404:
+            headers=headers,
+        )
+        if ret.status_code == 304 and cached is not None:
+            # Not modified; refresh the cache entry and serve the stored
+            # payload.
+            self._load_cache[(object_type, object_id)] = (
+                monotonic(),
+                cached[1],
+                cached[2],
+            )
+            return dict(cached[1]) if cached[1] is not None else None
+        elif ret.status_code == 404:
+            if self.cache_ttl > 0:
+                self._load_cache[(object_type, object_id)] = (monotonic(), None, None)
             return None
         elif ret.status_code != 200:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            return ret.json()
+            payload = json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
+        if self.cache_ttl > 0:
+            self._load_cache[(object_type, object_id)] = (
+                monotonic(),
+                dict(payload),
+                ret.headers.get("ETag"),
+            )
+
+        return payload
+
     def _list(
         self,
         object_type: str,
@@ -272,27 +614,11 @@ class BotB:
                     i += 1
 
             for cond in conditions:
-                params[f"conditions[{i}][key]"] = cond.property
-                params[f"conditions[{i}][property]"] = cond.property
-                params[f"conditions[{i}][operator]"] = cond.operator
-
-                if type(cond.operand) in (list, tuple):
-                    # Type ignore is necessary here since mypy can't tell we check for
-                    # lists/tuples only here
-                    if len(cond.operand) == 0:  # type: ignore
-                        raise ValueError("Length of list operand must be more than 0")
-                    elif len(cond.operand) == 1:  # type: ignore
-                        params[f"conditions[{i}][operand][]"] = param_stringify(
-                            cond.operand[0]  # type: ignore
-                        )
-                    else:
-                        for n in range(len(cond.operand)):  # type: ignore
-                            params[f"conditions[{i}][operand][{n}]"] = param_stringify(
-                                cond.operand[n]  # type: ignore
-                            )
-
-                else:
-                    params[f"conditions[{i}][operand]"] = param_stringify(cond.operand)  # type: ignore
+                # The fragments are precomputed by Condition.__post_init__;
+                # only the per-query condition index is filled in here.
+                prefix = f"conditions[{i}]"
+                for suffix, value in cond._encoded:
+                    params[prefix + suffix] = value
 
                 i += 1
 
@@ -302,10 +628,20 @@ class BotB:
             params["sort"] = sort
 
         if filters and not conditions:
-            filter_str = ""
-            for fkey, fval in filters.items():
-                filter_str += f"^{fkey}~{fval}"
-            filter_str = filter_str[1:]
+            # Sorting makes the cache key (and the built string) independent
+            # of the filter dict's insertion order.
+            try:
+                cache_key = tuple(sorted(filters.items()))
+            except TypeError:
+                cache_key = None
+
+            filter_str = _FILTER_STR_CACHE.get(cache_key) if cache_key else None
+            if filter_str is None:
+                filter_str = "^".join(
+                    f"{fkey}~{fval}" for fkey, fval in (cache_key or filters.items())
+                )
+                if cache_key:
+                    _FILTER_STR_CACHE[cache_key] = filter_str
             params["filters"] = filter_str
 
         if conditions:
@@ -320,13 +656,13 @@ class BotB:
             ret = self._s.get(url)
 
         if ret.status_code == 400 and "Please RTFM" in ret.text:
-            raise ValueError(ret.text.split("\n")[0].split("<br>")[0])
+            raise ValueError(ret.text.partition("\n")[0].partition("<br>")[0])
 
         if not ret.text:
             return []
 
         try:
-            return ret.json()
+            return json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
@@ -346,7 +682,7 @@ class BotB:
             raise ConnectionError(ret.text)
 
         try:
-            return ret.json()[0]
+            return json_loads(ret.content)[0]
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
@@ -378,7 +714,7 @@ class BotB:
             raise ConnectionError(ret.text)
 
         try:
-            return ret.json()
+            return json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
@@ -401,50 +737,6 @@ class BotB:
 
         return BotBr.from_payload(ret)
 
-    def _botbr_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[BotBr]:
-        """
-        Search for BotBrs that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.BotBr`.
-
-        :api: /api/v1/botbr/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of BotBr objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "botbr",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(BotBr.from_payload(payload))
-
-        return out
-
     def botbr_list(
         self,
         desc: bool = False,
@@ -496,30 +788,6 @@ class BotB:
 
         return BotBr.from_payload(ret)
 
-    def _botbr_search_noiter(
-        self, query: str, page_number: int = 0, page_length: int = 25
-    ) -> List[BotBr]:
-        """
-        Search for BotBrs that match the given query.
-
-        :api: /api/v1/botbr/search
-        :param query: Search query for the search.
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :returns: List of BotBr objects representing the search results. If the search
-            returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._search(
-            "botbr", query, page_number=page_number, page_length=page_length
-        )
-
-        out = []
-        for payload in ret:
-            out.append(BotBr.from_payload(payload))
-
-        return out
-
     def botbr_search(
         self, query: str, max_items: int = 0, offset: int = 0
     ) -> Iterable[BotBr]:
@@ -547,7 +815,7 @@ class BotB:
         """
         ret = self._s.get("https://battleofthebits.com/api/v1/botbr/levels")
 
-        return ret.json()
+        return json_loads(ret.content)
 
     def botbr_get_id_for_username(self, username: str) -> Union[int, None]:
         """
@@ -734,7 +1002,7 @@ class BotB:
             # Not found
             return out
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
 
         # .grid_4 > .inner:
         #   - div.t0.fright (progress / next threshold) \t (percentage)
@@ -743,7 +1011,7 @@ class BotB:
         for entry in soup.html.body.find_all("div", "grid_4"):  # type: ignore
             inner = list(entry.contents)[1]
             format = inner.find("span", "tb1").text.strip()
-            progress = int(inner.find("div", "t0").text.split("/")[0].strip())
+            progress = int(inner.find("div", "t0").text.partition("/")[0].strip())
             out[format] = progress
 
         return out
@@ -768,7 +1036,7 @@ class BotB:
             # Not found
             return []
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
 
         # First <p> element is Tags Given
         try:
@@ -796,7 +1064,7 @@ class BotB:
             # Not found
             return []
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
 
         # Second <p> element is Tags Received
         return list(parse_tag_cloud(soup.find_all("p")[1].prettify()).keys())
@@ -822,7 +1090,7 @@ class BotB:
             # Not found
             return []
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
 
         return [
             "https://battleofthebits.com" + img["src"] for img in soup.find_all("img")
@@ -879,9 +1147,20 @@ class BotB:
             # Not found
             return []
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
         battle_ids = []
 
+        # Whether we can stop collecting IDs once max_items is reached; this
+        # is loop-invariant, so evaluate it once instead of per link.
+        can_stop_early = (
+            max_items > 0
+            and sort == "id"
+            and desc is True
+            and not filters
+            and not conditions
+            and not offset
+        )
+
         i = 0
         for battle_a in soup.find_all("a"):
             battle_url = battle_a["href"]
@@ -889,22 +1168,14 @@ class BotB:
                 continue
 
             battle_id = int(
-                battle_url.split("https://battleofthebits.com/arena/Battle/")[1].split(
-                    "/"
-                )[0]
+                battle_url.partition("https://battleofthebits.com/arena/Battle/")[
+                    2
+                ].partition("/")[0]
             )
             battle_ids.append(battle_id)
 
             i += 1
-            if (
-                max_items > 0
-                and i > max_items
-                and sort == "id"
-                and desc is True
-                and not filters
-                and not conditions
-                and not offset
-            ):
+            if can_stop_early and i > max_items:
                 break
 
         _conditions = [Condition("id", "IN", battle_ids)]
@@ -938,7 +1209,7 @@ class BotB:
 
         ret = self._s.get(f"https://battleofthebits.com/barracks/Profile/{botbr.name}")
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
 
         try:
             flag_class = (
@@ -1017,51 +1288,6 @@ class BotB:
 
         return BotBrPoints.from_payload(ret)
 
-    def _botbr_points_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[BotBrPoints]:
-        """
-        Search for botbr_points objects that match the given query (Non-PaginatedList
-        version).
-
-        For a list of supported filter/condition properties, see :py:class:`.BotBrPoints`.
-
-        :api: /api/v1/botbr_points/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of BotBrPoints objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "botbr_points",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(BotBrPoints.from_payload(payload))
-
-        return out
-
     def botbr_points_list(
         self,
         desc: bool = False,
@@ -1127,6 +1353,11 @@ class BotB:
             found.
         :raises ConnectionError: On connection error.
         """
+        # Same ID-range short-circuit as _load; needed here too since this
+        # method goes through the list endpoint first (see below).
+        if not 0 < battle_id <= _MAX_ID:
+            return None
+
         # HACK: Battles loaded through the load endpoint don't have the period value;
         # use list instead with a filter on the ID value, and fall back to load if
         # that doesn't work.
@@ -1149,125 +1380,57 @@ class BotB:
 
         return Battle.from_payload(ret_load)
 
-    def _battle_list_noiter(
+    def battle_list(
         self,
-        page_number: int = 0,
-        page_length: int = 25,
         desc: bool = False,
         sort: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
         conditions: Optional[List[Condition]] = None,
-    ) -> List[Battle]:
+        max_items: int = 0,
+        offset: int = 0,
+    ) -> Iterable[Battle]:
         """
-        Search for battles that match the given query (Non-PaginatedList version).
+        Search for battles that match the given query.
 
         For a list of supported filter/condition properties, see :py:class:`.Battle`.
 
         :api: /api/v1/battle/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
         :param desc: If True, returns items in descending order. Requires sort key to be set.
         :param sort: Object property to sort by.
         :param filters: Dictionary with object property as the key and filter value
                         as the value. Note that filters are deprecated; conditions
                         should be used instead.
         :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Battle objects representing the search results. If the
-                  search returned no results, the list will be empty.
+        :param max_items: Maximum amount of items to return; 0 for no limit.
+        :param offset: Skip the first N items.
+        :returns: :class:`PaginatedList` of Battle objects representing the search results.
+                  If the search returned no results, the resulting iterable will return no
+                  results.
         :raises ConnectionError: On connection error.
         :raises ValueError: If a provided parameter is incorrect.
         """
-        ret = self._list(
-            "battle",
-            page_number=page_number,
-            page_length=page_length,
+        return PaginatedList(
+            self._battle_list_noiter,
             desc=desc,
             sort=sort,
             filters=filters,
             conditions=conditions,
+            max_items=max_items,
+            offset=offset,
         )
 
-        out = []
-        for payload in ret:
-            out.append(Battle.from_payload(payload))
+    def battle_random(self) -> Battle:
+        """
+        Get a random battle.
 
-        return out
-
-    def battle_list(
-        self,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-        max_items: int = 0,
-        offset: int = 0,
-    ) -> Iterable[Battle]:
-        """
-        Search for battles that match the given query.
-
-        For a list of supported filter/condition properties, see :py:class:`.Battle`.
-
-        :api: /api/v1/battle/list
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :param max_items: Maximum amount of items to return; 0 for no limit.
-        :param offset: Skip the first N items.
-        :returns: :class:`PaginatedList` of Battle objects representing the search results.
-                  If the search returned no results, the resulting iterable will return no
-                  results.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        return PaginatedList(
-            self._battle_list_noiter,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-            max_items=max_items,
-            offset=offset,
-        )
-
-    def battle_random(self) -> Battle:
-        """
-        Get a random battle.
-
-        :api: /api/v1/battle/random
-        :returns: Battle object representing the battle.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._random("battle")
+        :api: /api/v1/battle/random
+        :returns: Battle object representing the battle.
+        :raises ConnectionError: On connection error.
+        """
+        ret = self._random("battle")
 
         return Battle.from_payload(ret)
 
-    def _battle_search_noiter(
-        self, query: str, page_number: int = 0, page_length: int = 25
-    ) -> List[Battle]:
-        """
-        Search for battles that match the given query.
-
-        :api: /api/v1/battle/search
-        :param query: Search query for the search.
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :returns: List of Battle objects representing the search results. If the search
-            returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._search(
-            "battle", query, page_number=page_number, page_length=page_length
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Battle.from_payload(payload))
-
-        return out
-
     def battle_search(
         self, query: str, max_items: int = 0, offset: int = 0
     ) -> Iterable[Battle]:
@@ -1301,14 +1464,12 @@ class BotB:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            battles = ret.json()
+            battles = json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
-        out = []
-        for b in battles:
-            out.append(Battle.from_payload(b))
-        return out
+        from_payload = Battle.from_payload
+        return [from_payload(b) for b in battles]
 
     def battle_list_by_date(self, date: Union[str, dt_date, datetime]) -> List[Battle]:
         """
@@ -1346,14 +1507,12 @@ class BotB:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            battles = ret.json()
+            battles = json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
-        out = []
-        for b in battles:
-            out.append(Battle.from_payload(b))
-        return out
+        from_payload = Battle.from_payload
+        return [from_payload(b) for b in battles]
 
     def battle_list_by_month(self, date: str = "") -> List[Battle]:
         """
@@ -1375,14 +1534,12 @@ class BotB:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            battles = ret.json()
+            battles = json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
-        out = []
-        for b in battles:
-            out.append(Battle.from_payload(b))
-        return out
+        from_payload = Battle.from_payload
+        return [from_payload(b) for b in battles]
 
     def battle_get_entries(
         self,
@@ -1453,7 +1610,7 @@ class BotB:
         if ret.status_code != 200:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
         try:
             return soup.find("div", "inner").find("div", "t1").decode_contents()  # type: ignore
         except (AttributeError, IndexError, KeyError):
@@ -1480,7 +1637,7 @@ class BotB:
         if ret.status_code != 200:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
         try:
             out = [
                 c.strip()
@@ -1525,7 +1682,7 @@ class BotB:
         if ret.status_code != 200:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
-        soup = BeautifulSoup(ret.text, "lxml")
+        soup = _get_soup(ret.text)
         try:
             return list(
                 reversed(
@@ -1559,50 +1716,6 @@ class BotB:
 
         return Entry.from_payload(ret)
 
-    def _entry_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[Entry]:
-        """
-        Search for entries that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.Entry`.
-
-        :api: /api/v1/entry/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Entry objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "entry",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Entry.from_payload(payload))
-
-        return out
-
     def entry_list(
         self,
         desc: bool = False,
@@ -1654,30 +1767,6 @@ class BotB:
 
         return Entry.from_payload(ret)
 
-    def _entry_search_noiter(
-        self, query: str, page_number: int = 0, page_length: int = 25
-    ) -> List[Entry]:
-        """
-        Search for entries that match the given query.
-
-        :api: /api/v1/entry/search
-        :param query: Search query for the search.
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :returns: List of Entry objects representing the search results. If the search
-            returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._search(
-            "entry", query, page_number=page_number, page_length=page_length
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Entry.from_payload(payload))
-
-        return out
-
     def entry_search(
         self, query: str, max_items: int = 0, offset: int = 0
     ) -> Iterable[Entry]:
@@ -1850,50 +1939,6 @@ class BotB:
 
         return Favorite.from_payload(ret)
 
-    def _favorite_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[Favorite]:
-        """
-        Search for favorites that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.Favorite`.
-
-        :api: /api/v1/favorite/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Favorite objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "favorite",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Favorite.from_payload(payload))
-
-        return out
-
     def favorite_list(
         self,
         desc: bool = False,
@@ -1965,50 +2010,6 @@ class BotB:
 
         return Format.from_payload(ret)
 
-    def _format_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[Format]:
-        """
-        Search for formats that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.Format`.
-
-        :api: /api/v1/format/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Format objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "format",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Format.from_payload(payload))
-
-        return out
-
     def format_list(
         self,
         desc: bool = False,
@@ -2080,50 +2081,6 @@ class BotB:
 
         return GroupThread.from_payload(ret)
 
-    def _group_thread_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[GroupThread]:
-        """
-        Search for group threads that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.GroupThread`.
-
-        :api: /api/v1/group_thread/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of GroupThread objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "group_thread",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(GroupThread.from_payload(payload))
-
-        return out
-
     def group_thread_list(
         self,
         desc: bool = False,
@@ -2175,43 +2132,19 @@ class BotB:
 
         return GroupThread.from_payload(ret)
 
-    def _group_thread_search_noiter(
-        self, query: str, page_number: int = 0, page_length: int = 25
-    ) -> List[GroupThread]:
+    def group_thread_search(
+        self, query: str, max_items: int = 0, offset: int = 0
+    ) -> Iterable[GroupThread]:
         """
         Search for group threads that match the given query.
 
         :api: /api/v1/group_thread/search
         :param query: Search query for the search.
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :returns: List of GroupThread objects representing the search results. If the
-            search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._search(
-            "group_thread", query, page_number=page_number, page_length=page_length
-        )
-
-        out = []
-        for payload in ret:
-            out.append(GroupThread.from_payload(payload))
-
-        return out
-
-    def group_thread_search(
-        self, query: str, max_items: int = 0, offset: int = 0
-    ) -> Iterable[GroupThread]:
-        """
-        Search for group threads that match the given query.
-
-        :api: /api/v1/group_thread/search
-        :param query: Search query for the search.
-        :param max_items: Maximum amount of items to return; 0 for no limit.
-        :param offset: Skip the first N items.
-        :returns: :class:`PaginatedList` of GroupThread objects representing the search results.
-            If the search returned no results, the resulting iterable will return no
-            results.
+        :param max_items: Maximum amount of items to return; 0 for no limit.
+        :param offset: Skip the first N items.
+        :returns: :class:`PaginatedList` of GroupThread objects representing the search results.
+            If the search returned no results, the resulting iterable will return no
+            results.
         :raises ConnectionError: On connection error.
         """
         return PaginatedList(
@@ -2241,51 +2174,6 @@ class BotB:
 
         return LyceumArticle.from_payload(ret)
 
-    def _lyceum_article_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[LyceumArticle]:
-        """
-        Search for lyceum articles that match the given query (Non-PaginatedList
-        version).
-
-        For a list of supported filter/condition properties, see :py:class:`.LyceumArticle`.
-
-        :api: /api/v1/lyceum_article/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of LyceumArticle objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "lyceum_article",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(LyceumArticle.from_payload(payload))
-
-        return out
-
     def lyceum_article_list(
         self,
         desc: bool = False,
@@ -2337,30 +2225,6 @@ class BotB:
 
         return LyceumArticle.from_payload(ret)
 
-    def _lyceum_article_search_noiter(
-        self, query: str, page_number: int = 0, page_length: int = 25
-    ) -> List[LyceumArticle]:
-        """
-        Search for lyceum articles that match the given query.
-
-        :api: /api/v1/lyceum_article/search
-        :param query: Search query for the search.
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :returns: List of LyceumArticle objects representing the search results. If the
-            search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._search(
-            "lyceum_article", query, page_number=page_number, page_length=page_length
-        )
-
-        out = []
-        for payload in ret:
-            out.append(LyceumArticle.from_payload(payload))
-
-        return out
-
     def lyceum_article_search(
         self,
         query: str,
@@ -2406,50 +2270,6 @@ class BotB:
 
         return Palette.from_payload(ret)
 
-    def _palette_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[Palette]:
-        """
-        Search for palettes that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.Palette`.
-
-        :api: /api/v1/palette/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Palette objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "palette",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Palette.from_payload(payload))
-
-        return out
-
     def palette_list(
         self,
         desc: bool = False,
@@ -2514,7 +2334,7 @@ class BotB:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            palette_json = ret.json()[0]
+            palette_json = json_loads(ret.content)[0]
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
@@ -2540,50 +2360,6 @@ class BotB:
 
         return Playlist.from_payload(ret)
 
-    def _playlist_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[Playlist]:
-        """
-        Search for playlists that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.Playlist`.
-
-        :api: /api/v1/playlist/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Playlist objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "playlist",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Playlist.from_payload(payload))
-
-        return out
-
     def playlist_list(
         self,
         desc: bool = False,
@@ -2635,30 +2411,6 @@ class BotB:
 
         return Playlist.from_payload(ret)
 
-    def _playlist_search_noiter(
-        self, query: str, page_number: int = 0, page_length: int = 25
-    ) -> List[Playlist]:
-        """
-        Search for playlists that match the given query.
-
-        :api: /api/v1/playlist/search
-        :param query: Search query for the search.
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :returns: List of Playlist objects representing the search results. If the
-            search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._search(
-            "playlist", query, page_number=page_number, page_length=page_length
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Playlist.from_payload(payload))
-
-        return out
-
     def playlist_search(
         self, query: str, max_items: int = 0, offset: int = 0
     ) -> Iterable[Playlist]:
@@ -2681,53 +2433,6 @@ class BotB:
             offset=offset,
         )
 
-    def _playlist_to_entry_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[PlaylistToEntry]:
-        """
-        Perform a query against the playlist-to-entry table.
-
-        In most cases, you don't need to use this function directly; instead, use
-        `:py:method:.BotB.playlist_get_entries` or
-        `:py:method:.BotB.entry_get_playlists`.
-
-        :api: /api/v1/playlist_to_entry/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be
-            set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value as
-            the value. Note that filters are deprecated; conditions should be used
-            instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Playlist objects representing the search results. If the
-            search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "playlist_to_entry",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(PlaylistToEntry.from_payload(payload))
-
-        return out
-
     def playlist_get_entry_ids(
         self, playlist_id: int, max_items: int = 0, offset: int = 0
     ) -> List[int]:
@@ -2772,14 +2477,12 @@ class BotB:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            entries = ret.json()
+            entries = json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
-        out = []
-        for entry in entries:
-            out.append(Entry.from_payload(entry))
-        return out
+        from_payload = Entry.from_payload
+        return [from_payload(entry) for entry in entries]
 
     #
     # Tags
@@ -2800,50 +2503,6 @@ class BotB:
 
         return Tag.from_payload(ret)
 
-    def _tag_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[Tag]:
-        """
-        Search for tags that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.Tag`.
-
-        :api: /api/v1/tag/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of Tag objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "tag",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Tag.from_payload(payload))
-
-        return out
-
     def tag_list(
         self,
         desc: bool = False,
@@ -2895,30 +2554,6 @@ class BotB:
 
         return Tag.from_payload(ret)
 
-    def _tag_search_noiter(
-        self, query: str, page_number: int = 0, page_length: int = 25
-    ) -> List[Tag]:
-        """
-        Search for tags that match the given query.
-
-        :api: /api/v1/tag/search
-        :param query: Search query for the search.
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :returns: List of Tag objects representing the search results. If the search
-            returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        """
-        ret = self._search(
-            "tag", query, page_number=page_number, page_length=page_length
-        )
-
-        out = []
-        for payload in ret:
-            out.append(Tag.from_payload(payload))
-
-        return out
-
     def tag_search(
         self, query: str, max_items: int = 0, offset: int = 0
     ) -> Iterable[Tag]:
@@ -3033,50 +2668,6 @@ class BotB:
     # BotBr stats
     #
 
-    def _botbr_stats_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[BotBrStats]:
-        """
-        Search for BotBr stats that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.BotBrStats`.
-
-        :api: /api/v1/botbr_stats/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of BotBrStats objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "botbr_stats",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(BotBrStats.from_payload(payload))
-
-        return out
-
     def botbr_stats_list(
         self,
         desc: bool = False,
@@ -3134,14 +2725,12 @@ class BotB:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            stats = ret.json()
+            stats = json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
-        out = []
-        for stat in stats:
-            out.append(BotBrStats.from_payload(stat))
-        return out
+        from_payload = BotBrStats.from_payload
+        return [from_payload(stat) for stat in stats]
 
     def botbr_stats_days_back(self, botbr_id: int, n_days: int) -> List[BotBrStats]:
         """
@@ -3162,14 +2751,12 @@ class BotB:
             raise ConnectionError(f"{ret.status_code}: {ret.text}")
 
         try:
-            stats = ret.json()
+            stats = json_loads(ret.content)
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
-        out = []
-        for stat in stats:
-            out.append(BotBrStats.from_payload(stat))
-        return out
+        from_payload = BotBrStats.from_payload
+        return [from_payload(stat) for stat in stats]
 
     def botbr_stats_random(self) -> BotBrStats:
         """
@@ -3203,50 +2790,6 @@ class BotB:
 
         return DailyStats.from_payload(ret)
 
-    def _daily_stats_list_noiter(
-        self,
-        page_number: int = 0,
-        page_length: int = 25,
-        desc: bool = False,
-        sort: Optional[str] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[List[Condition]] = None,
-    ) -> List[DailyStats]:
-        """
-        Search for daily stats that match the given query (Non-PaginatedList version).
-
-        For a list of supported filter/condition properties, see :py:class:`.DailyStats`.
-
-        :api: /api/v1/daily_stats/list
-        :param page_number: Number of the list page, for pagination.
-        :param page_length: Length of the list page, for pagination (max. 250).
-        :param desc: If True, returns items in descending order. Requires sort key to be set.
-        :param sort: Object property to sort by.
-        :param filters: Dictionary with object property as the key and filter value
-                        as the value. Note that filters are deprecated; conditions
-                        should be used instead.
-        :param conditions: List of Condition objects containing list conditions.
-        :returns: List of DailyStats objects representing the search results. If the
-                  search returned no results, the list will be empty.
-        :raises ConnectionError: On connection error.
-        :raises ValueError: If a provided parameter is incorrect.
-        """
-        ret = self._list(
-            "daily_stats",
-            page_number=page_number,
-            page_length=page_length,
-            desc=desc,
-            sort=sort,
-            filters=filters,
-            conditions=conditions,
-        )
-
-        out = []
-        for payload in ret:
-            out.append(DailyStats.from_payload(payload))
-
-        return out
-
     def daily_stats_list(
         self,
         desc: bool = False,
@@ -3321,7 +2864,7 @@ class BotB:
         try:
             # HACK: Firki interpret API always ends the returned string with "</span>"
             # (no matching starting bracket). It is removed here for ease-of-use.
-            return ret.json()[0][:-7]
+            return json_loads(ret.content)[0][:-7]
         except Exception as e:
             raise ConnectionError(ret.text) from e
 
@@ -3337,11 +2880,74 @@ class BotB:
         :returns: The API version.
         :raises ConnectionError: On connection error.
         """
+        # The version only changes when the site is redeployed; one fetch
+        # per client instance is plenty.
+        try:
+            return self._spriteshit_version
+        except AttributeError:
+            pass
+
         ret = self._s.get("https://battleofthebits.com/api/v1/spriteshit/version")
         if ret.status_code == 500:
             raise ConnectionError(ret.text)
 
         try:
-            return ret.json()["spriteshit_version"]
+            self._spriteshit_version = json_loads(ret.content)["spriteshit_version"]
         except Exception as e:
             raise ConnectionError(ret.text) from e
+
+        return self._spriteshit_version
+
+
+# Private per-object-type list/search methods used by the public wrappers
+# above; see _make_list_noiter and _make_search_noiter.
+for _object_type, _cls in (
+    ("botbr", BotBr),
+    ("botbr_points", BotBrPoints),
+    ("battle", Battle),
+    ("entry", Entry),
+    ("favorite", Favorite),
+    ("format", Format),
+    ("group_thread", GroupThread),
+    ("lyceum_article", LyceumArticle),
+    ("palette", Palette),
+    ("playlist", Playlist),
+    ("playlist_to_entry", PlaylistToEntry),
+    ("tag", Tag),
+    ("botbr_stats", BotBrStats),
+    ("daily_stats", DailyStats),
+):
+    setattr(BotB, f"_{_object_type}_list_noiter", _make_list_noiter(_object_type, _cls))
+
+# Batched by-ID loads on top of the list endpoint; playlist_to_entry is
+# skipped since its IDs are not exposed anywhere (see IGNORED_ENDPOINTS in
+# tools/check_api_coverage.py), as is format, which is keyed by token.
+for _object_type, _cls in (
+    ("botbr", BotBr),
+    ("botbr_points", BotBrPoints),
+    ("battle", Battle),
+    ("entry", Entry),
+    ("favorite", Favorite),
+    ("group_thread", GroupThread),
+    ("lyceum_article", LyceumArticle),
+    ("palette", Palette),
+    ("playlist", Playlist),
+    ("tag", Tag),
+    ("daily_stats", DailyStats),
+):
+    setattr(BotB, f"{_object_type}_load_many", _make_load_many(_object_type, _cls))
+
+for _object_type, _cls in (
+    ("botbr", BotBr),
+    ("battle", Battle),
+    ("entry", Entry),
+    ("group_thread", GroupThread),
+    ("lyceum_article", LyceumArticle),
+    ("playlist", Playlist),
+    ("tag", Tag),
+):
+    setattr(
+        BotB, f"_{_object_type}_search_noiter", _make_search_noiter(_object_type, _cls)
+    )
+
+del _object_type, _cls
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MIT
+"""
+Client-side helpers for working with Firki markup.
+
+Firki is BotB's own markup language, used e.g. for Lyceum articles and posts.
+For server-side rendering to HTML, see :func:`pybotb.botb.BotB.firki_interpret`.
+"""
+
+from dataclasses import dataclass, field
+import re
+from typing import Iterator, List, Optional, Union
+
+#: Matches a single Firki token ("'[action]" or "'[action:param:...]").
+_TOKEN_RE = re.compile(r"'\[([^\[\]]*)\]")
+
+
+@dataclass
+class FirkiToken:
+    """A single Firki markup token, e.g. "'[b]" or "'[url:...]"."""
+
+    #: Action of the token (e.g. "b", "/b", "url").
+    action: str
+
+    #: Parameters of the token, if any.
+    params: List[str] = field(default_factory=list)
+
+    def __str__(self):
+        # Serialized in one pass; repeated "+=" concatenation would be
+        # quadratic in the parameter count.
+        return "'[" + ":".join([self.action] + self.params) + "]"
+
+
+class Firki:
+    """
+    Parsed representation of a Firki markup document.
+
+    Iterating over a Firki object yields the plain-text segments as strings and
+    the tokens as :class:`FirkiToken` objects, in document order. Iteration is
+    backed by a generator over the source string; the fully materialized list
+    is only built (and memoized) on explicit :attr:`markup` access.
+    """
+
+    def __init__(self, source: str):
+        """
+        Initialize the Firki document.
+
+        :param source: Raw Firki markup source.
+        """
+        self._source = source
+        self._markup: Optional[List[Union[str, FirkiToken]]] = None
+
+    def __iter__(self) -> Iterator[Union[str, FirkiToken]]:
+        last = 0
+        for match in _TOKEN_RE.finditer(self._source):
+            if match.start() > last:
+                yield self._source[last : match.start()]
+            action, _, params = match.group(1).partition(":")
+            yield FirkiToken(action, params.split(":") if params else [])
+            last = match.end()
+        if last < len(self._source):
+            yield self._source[last:]
+
+    @property
+    def markup(self) -> List[Union[str, FirkiToken]]:
+        """Parsed markup, as a list of strings and :class:`FirkiToken` objects."""
+        if self._markup is None:
+            self._markup = list(self)
+        return self._markup
+
+    def __str__(self):
+        return "".join(str(part) for part in self)
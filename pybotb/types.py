@@ -3,28 +3,118 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 from enum_tools.documentation import document_enum
-import pytz
+from functools import cached_property, lru_cache
+from operator import attrgetter
+import os
 from typing import (
     Dict,
     List,
     Optional,
 )
 import sys
+from typing import Self
+from zoneinfo import ZoneInfo
 
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
-    from typing_extensions import Self
-import re
+from .utils import unroll_payload, cached_property_dep, precompile_plan
 
-try:  # Python >= 3.11
-    from enum import StrEnum
-except ImportError:
-    from strenum import StrEnum  # type: ignore
+#: All dates on BotB are in the US West Coast timezone; look it up once
+#: instead of once per datetime conversion.
+_LA_TZ = ZoneInfo("America/Los_Angeles")
 
-from .utils import unroll_payload, cached_property_dep
+#: Whether from_payload methods keep a reference to the raw payload on the
+#: resulting object (see the _raw_payload fields). On by default; can be
+#: disabled for memory-sensitive bulk parses through the
+#: PYBOTB_KEEP_RAW_PAYLOAD=0 environment variable or set_keep_raw_payload().
+_keep_raw_payload = os.environ.get("PYBOTB_KEEP_RAW_PAYLOAD", "1") != "0"
+
+
+def set_keep_raw_payload(keep: bool):
+    """
+    Enable or disable raw payload capture in the from_payload methods.
+
+    When disabled, the _raw_payload attribute of newly parsed objects is left
+    as None, so bulk parses do not keep every source dict alive.
+
+    :param keep: Whether to store raw payloads on parsed objects.
+    """
+    global _keep_raw_payload
+    _keep_raw_payload = keep
+
+
+# Optional C accelerators are skipped when PYBOTB_PURE_PYTHON is set; on
+# alternative interpreters like PyPy the pure-Python paths trace and inline
+# better than calls into C extensions.
+_parse_dt = None
+if not os.environ.get("PYBOTB_PURE_PYTHON"):
+    try:
+        from ciso8601 import parse_datetime as _parse_dt  # noqa: F811
+    except ImportError:
+        pass
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_string: str) -> datetime:
+    """
+    Parse a "YYYY-MM-DD" string into a datetime in the site's timezone.
+
+    Date-only strings repeat heavily across rows (e.g. daily BotBr stats), so
+    the results are memoized; datetime objects are immutable, making the
+    shared instances safe.
+    """
+    return datetime(
+        int(date_string[0:4]),
+        int(date_string[5:7]),
+        int(date_string[8:10]),
+        tzinfo=_LA_TZ,
+    )
+
+
+def _parse_ymd_hms(date_string: str) -> datetime:
+    """Parse a "YYYY-MM-DD HH:MM:SS" string into a datetime in the site's timezone."""
+    return datetime(
+        int(date_string[0:4]),
+        int(date_string[5:7]),
+        int(date_string[8:10]),
+        int(date_string[11:13]),
+        int(date_string[14:16]),
+        int(date_string[17:19]),
+        tzinfo=_LA_TZ,
+    )
+
+
+#: Fixed-offset parsers for the two date formats the site uses.
+_FMT_PARSERS = {"%Y-%m-%d": _parse_ymd, "%Y-%m-%d %H:%M:%S": _parse_ymd_hms}
+
+
+def _to_la_datetime(date_string: str, fmt: str) -> datetime:
+    """
+    Parse a site-provided date string into a datetime in the site's timezone.
+
+    The site only ever emits two fixed-width formats, so the common path
+    parses by direct slicing (or through ciso8601 when it is installed);
+    datetime.strptime, which re-interprets its format string on every call,
+    is kept as a fallback for anything malformed or unexpected.
+
+    :param date_string: Date string, e.g. "2024-01-02" or "2024-01-02 10:00:00".
+    :param fmt: strptime format of the date string, used by the fallback path.
+    :returns: The parsed datetime, with tzinfo set to the site's timezone.
+    """
+    if _parse_dt is not None:
+        try:
+            return _parse_dt(date_string).replace(tzinfo=_LA_TZ)
+        except ValueError:
+            pass
+
+    parser = _FMT_PARSERS.get(fmt)
+    if parser is not None:
+        try:
+            return parser(date_string)
+        except ValueError:
+            pass
+
+    return datetime.strptime(date_string, fmt).replace(tzinfo=_LA_TZ)
 
 
 @document_enum
@@ -43,6 +133,15 @@ class BadgeLevel(IntEnum):
     GOLD = 4
 
 
+#: Payload-to-attribute rename map for :class:`BotBr`; hoisted to module
+#: level so the unroll_payload plan cache sees one stable dict per class.
+_BOTBR_PAYLOAD_TO_ATTR = {
+    "class": "botbr_class",
+    "create_date": "create_date_str",
+    "laston_date": "laston_date_str",
+}
+
+
 @dataclass
 class BotBr:
     """
@@ -60,7 +159,7 @@ class BotBr:
     #: Fallback color for the aura, as a hex value (#ffffff).
     aura_color: str
 
-    @property
+    @cached_property_dep(attr="aura")
     def aura_url(self) -> str:
         """
         URL to the aura PNG; calculated from :attr:`.BotBr.aura`.
@@ -111,9 +210,7 @@ class BotBr:
         For the raw string, see
         :attr:`.BotBr.create_date_str`.
         """
-        return datetime.strptime(self.create_date_str, "%Y-%m-%d").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.create_date_str, "%Y-%m-%d")
 
     #: The BotBr's ID.
     id: int
@@ -134,9 +231,7 @@ class BotBr:
         For the raw string, see
         :attr:`.BotBr.laston_date_str`.
         """
-        return datetime.strptime(self.laston_date_str, "%Y-%m-%d").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.laston_date_str, "%Y-%m-%d")
 
     #: The BotBr's current level.
     level: int
@@ -182,25 +277,40 @@ class BotBr:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting BotBr object.
         """
-        payload_parsed = payload.copy()
+        payload_parsed = dict(payload)
+
+        # SITE BUG: empty badge_levels becomes a list instead of a dict
+        if isinstance(payload["badge_levels"], list):
+            payload_parsed["badge_levels"] = {}
+        else:
+            # Convert badge levels through the value-to-member map directly;
+            # BadgeLevel.__call__ would run its validation dispatch per item.
+            # Values outside the known levels are passed through untouched.
+            badge_level_map = BadgeLevel._value2member_map_
+            payload_parsed["badge_levels"] = {
+                sys.intern(key): badge_level_map.get(ival := int(val), ival)
+                for key, val in payload["badge_levels"].items()
+            }
 
         # SITE BUG: empty points_array becomes a list instead of a dict
-        if isinstance(payload_parsed["points_array"], list):
+        if isinstance(payload["points_array"], list):
             payload_parsed["points_array"] = {}
         else:
-            for key, val in payload_parsed["points_array"].copy().items():
-                payload_parsed["points_array"][key] = int(val)
+            # Class names repeat across every BotBr; intern them so the dicts
+            # share key storage.
+            payload_parsed["points_array"] = {
+                sys.intern(key): int(val)
+                for key, val in payload["points_array"].items()
+            }
 
         ret = unroll_payload(
             cls,
             payload_parsed,
-            payload_to_attr={
-                "class": "botbr_class",
-                "create_date": "create_date_str",
-                "laston_date": "laston_date_str",
-            },
+            payload_to_attr=_BOTBR_PAYLOAD_TO_ATTR,
         )
-        ret._raw_payload = payload.copy()
+        ret.botbr_class = sys.intern(ret.botbr_class)
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -211,7 +321,8 @@ class BotBr:
         return self.__repr__()
 
 
-@dataclass
+# Slotted: no cached properties on this class need an instance __dict__.
+@dataclass(slots=True)
 class BotBrPoints:
     """Represents the point stats for a single BotBr, for a specific class."""
 
@@ -239,10 +350,9 @@ class BotBrPoints:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting BotBr object.
         """
-        payload_parsed = payload.copy()
-
-        ret = unroll_payload(cls, payload_parsed)
-        ret._raw_payload = payload.copy()
+        ret = unroll_payload(cls, payload)
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -267,7 +377,29 @@ class Medium(StrEnum):
     VISUAL = "visual"
 
 
-@dataclass
+#: Entry payloads mark the medium by including one of these keys; see
+#: Entry.from_payload.
+_MEDIUM_KEYS = (("medium_audio", Medium.AUDIO), ("medium_visual", Medium.VISUAL))
+
+
+def _alias_of(attr: str, doc: str) -> property:
+    """
+    Build a property that aliases another attribute.
+
+    The getter is an operator.attrgetter, which runs at C level instead of
+    dispatching into a Python forwarder function on every access.
+
+    :param attr: Name of the aliased attribute.
+    :param doc: Docstring for the property.
+    :returns: The alias property.
+    """
+    return property(
+        attrgetter(attr), lambda self, value: setattr(self, attr, value), doc=doc
+    )
+
+
+# Slotted: no cached properties on this class need an instance __dict__.
+@dataclass(slots=True)
 class Format:
     """Represents a format."""
 
@@ -316,17 +448,18 @@ class Format:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting Format object.
         """
-        payload_parsed = payload.copy()
+        payload_parsed = dict(payload)
 
         # HACK: some maxfilesize values are malformed and have stray unicode characters.
         # Extract just the number.
         if type(payload["maxfilesize"]) is str:
             payload_parsed["maxfilesize"] = int(
-                "".join(re.findall(r"\d+", payload["maxfilesize"].strip()))
+                "".join(filter(str.isdigit, payload["maxfilesize"]))
             )
 
         ret = unroll_payload(cls, payload_parsed)
-        ret._raw_payload = payload.copy()
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -359,6 +492,17 @@ class BattlePeriod(StrEnum):
     END = "end"
 
 
+#: Payload-to-attribute rename map for :class:`Battle`.
+_BATTLE_PAYLOAD_TO_ATTR = {
+    "start": "start_str",
+    "end": "end_str",
+    "period_end": "period_end_str",
+}
+
+
+# Unslotted: the start/end/period_end accessors cache per instance through
+# cached_property_dep, which stores into the instance __dict__; their
+# HH:MM:SS timestamps are too unique for a shared parse cache to help.
 @dataclass
 class Battle:
     """Represents a battle."""
@@ -435,9 +579,7 @@ class Battle:
 
         For the raw string, see :attr:`.start_str`.
         """
-        return datetime.strptime(self.start_str, "%Y-%m-%d %H:%M:%S").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.start_str, "%Y-%m-%d %H:%M:%S")
 
     #: String representing the date and time at which the battle ends, in
     #: YYYY-MM-DD HH:MM:SS format, in the US East Coast timezone (same as all
@@ -460,9 +602,7 @@ class Battle:
 
         For the raw string, see :attr:`.end_str`.
         """
-        return datetime.strptime(self.end_str, "%Y-%m-%d %H:%M:%S").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.end_str, "%Y-%m-%d %H:%M:%S")
 
     #: List of format tokens for this battle. For XHBs, this will contain one
     #: item; for majors, there may be more formats.
@@ -500,9 +640,7 @@ class Battle:
         if self.period_end_str is None:
             return None
 
-        return datetime.strptime(self.period_end_str, "%Y-%m-%d %H:%M:%S").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.period_end_str, "%Y-%m-%d %H:%M:%S")
 
     #: False if the "no late penalties" option is enabled.
     #:
@@ -521,7 +659,7 @@ class Battle:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting Battle object.
         """
-        payload_parsed = payload.copy()
+        payload_parsed = dict(payload)
 
         #: HACK: Battles in the tally period have no "period" property,
         #: but they do have a period_end.
@@ -531,13 +669,10 @@ class Battle:
         ret = unroll_payload(
             cls,
             payload_parsed,
-            payload_to_attr={
-                "start": "start_str",
-                "end": "end_str",
-                "period_end": "period_end_str",
-            },
+            payload_to_attr=_BATTLE_PAYLOAD_TO_ATTR,
         )
-        ret._raw_payload = payload.copy()
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -548,6 +683,12 @@ class Battle:
         return self.__repr__()
 
 
+#: Payload-to-attribute rename map for :class:`EntryAuthor`.
+_ENTRY_AUTHOR_PAYLOAD_TO_ATTR = {
+    "class": "botbr_class",
+}
+
+
 @dataclass
 class EntryAuthor:
     """
@@ -564,7 +705,7 @@ class EntryAuthor:
     #: Fallback color for the aura, as a hex value (#ffffff).
     aura_color: str
 
-    @property
+    @cached_property_dep(attr="aura")
     def aura_url(self) -> str:
         """
         URL to the aura PNG; calculated from :attr:`.aura`.
@@ -624,11 +765,17 @@ class EntryAuthor:
         ret = unroll_payload(
             cls,
             payload,
-            payload_to_attr={
-                "class": "botbr_class",
-            },
+            payload_to_attr=_ENTRY_AUTHOR_PAYLOAD_TO_ATTR,
         )
-        ret._raw_payload = payload.copy()
+
+        # These fields have a handful of possible values repeated across every
+        # author in a bulk fetch; intern them so equal strings share storage.
+        ret.botbr_class = sys.intern(ret.botbr_class)
+        ret.country_code = sys.intern(ret.country_code)
+        ret.country_name = sys.intern(ret.country_name)
+
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -639,6 +786,12 @@ class EntryAuthor:
         return self.__repr__()
 
 
+#: Payload-to-attribute rename map for :class:`Entry`.
+_ENTRY_PAYLOAD_TO_ATTR = {
+    "datetime": "datetime_str",
+}
+
+
 @dataclass
 class Entry:
     """Represents a battle entry."""
@@ -652,14 +805,28 @@ class Entry:
     #: ID of the BotBr who submitted this entry.
     botbr_id: int
 
-    #: The BotBr who submitted this entry.
-    botbr: BotBr
-
     #: ID of the battle this entry was submitted to.
     battle_id: int
 
-    #: The battle this entry was submitted to.
-    battle: Battle
+    @cached_property
+    def botbr(self) -> BotBr:
+        """
+        The BotBr who submitted this entry.
+
+        Built lazily from the sub-payload on first access; entries fetched in
+        bulk often never have their author objects inspected, and building
+        them eagerly would cascade into date parsing per entry.
+        """
+        return BotBr.from_payload(self._botbr_payload)
+
+    @cached_property
+    def battle(self) -> Battle:
+        """
+        The battle this entry was submitted to.
+
+        Built lazily from the sub-payload on first access; see :attr:`.botbr`.
+        """
+        return Battle.from_payload(self._battle_payload)
 
     #: String representing the submission date of this entry in YYYY-MM-DD
     #: HH:MM:SS format, in the US East Coast timezone (same as all other dates
@@ -677,9 +844,7 @@ class Entry:
         For the raw string, see
         :attr:`.Entry.datetime_str`.
         """
-        return datetime.strptime(self.datetime_str, "%Y-%m-%d %H:%M:%S").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.datetime_str, "%Y-%m-%d %H:%M:%S")
 
     #: The submission date in a human-readable format, as displayed on BotB.
     #:
@@ -691,26 +856,16 @@ class Entry:
     #: Amount of downloads the entry has (note the deliberate typo).
     donloads: int
 
-    @property
-    def downloads(self) -> int:
-        """Longhand for "donloads", for spelling convenience."""
-        return self.donloads
-
-    @downloads.setter
-    def downloads(self, downloads: int):
-        self.donloads = downloads
+    downloads = _alias_of(
+        "donloads", 'Longhand for "donloads", for spelling convenience.'
+    )
 
     #: Relative URL to the entry source file, for downloading (note the deliberate typo).
     donload_url: str
 
-    @property
-    def download_url(self) -> str:
-        """Longhand for "donload_url", for spelling convenience."""
-        return self.donload_url
-
-    @download_url.setter
-    def download_url(self, download_url: str):
-        self.donload_url = download_url
+    download_url = _alias_of(
+        "donload_url", 'Longhand for "donload_url", for spelling convenience.'
+    )
 
     #: Amount of favorites the entry has.
     favs: int
@@ -822,6 +977,12 @@ class Entry:
     #: TODO: make a custom prop out of this
     trophy_display: Optional[str] = None
 
+    #: Sub-payload that :attr:`.botbr` is lazily built from.
+    _botbr_payload: Optional[dict] = field(default=None, repr=False)
+
+    #: Sub-payload that :attr:`.battle` is lazily built from.
+    _battle_payload: Optional[dict] = field(default=None, repr=False)
+
     #: Raw JSON payload used to create this class. Useful if e.g. you need a raw
     #: value that isn't exposed through the class.
     _raw_payload: Optional[dict] = field(default=None, repr=False)
@@ -834,14 +995,11 @@ class Entry:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting Entry object.
         """
-        payload_parsed = payload.copy()
+        payload_parsed = dict(payload)
 
-        if "medium_audio" in payload_parsed:
-            payload_parsed["medium"] = Medium.AUDIO
-        elif "medium_visual" in payload_parsed:
-            payload_parsed["medium"] = Medium.VISUAL
-        else:
-            payload_parsed["medium"] = Medium.OTHER
+        payload_parsed["medium"] = next(
+            (medium for key, medium in _MEDIUM_KEYS if key in payload), Medium.OTHER
+        )
 
         # HACK: some old entries from 2009 don't have an attached comment thread,
         # which causes the "posts" value to be missing
@@ -850,17 +1008,39 @@ class Entry:
         if "posts" not in payload_parsed:
             payload_parsed["posts"] = 0
 
+        # The botbr/battle sub-objects are materialized lazily; see the
+        # properties above.
+        botbr_payload = payload_parsed.pop("botbr", None)
+        battle_payload = payload_parsed.pop("battle", None)
+
         ret = unroll_payload(
             cls,
             payload_parsed,
-            payload_to_attr={
-                "datetime": "datetime_str",
-            },
+            payload_to_attr=_ENTRY_PAYLOAD_TO_ATTR,
         )
-        ret._raw_payload = payload.copy()
+        ret._botbr_payload = botbr_payload
+        ret._battle_payload = battle_payload
+        ret.format_token = sys.intern(ret.format_token)
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
+    @classmethod
+    def from_payload_list(cls, payloads: List[dict]) -> List[Self]:
+        """
+        Convert a list of JSON payloads into a list of Entry objects.
+
+        Bulk counterpart to :meth:`.Entry.from_payload`, for callers that
+        materialize entire battle listings at once; binds the constructor
+        locally so the loop stays free of repeated attribute lookups.
+
+        :param payloads: List of dictionaries containing the JSON payloads.
+        :returns: List of the resulting Entry objects.
+        """
+        from_payload = cls.from_payload
+        return [from_payload(payload) for payload in payloads]
+
     def __repr__(self):
         return f'<Entry: "{self.title}" by {self.authors_display} (Format {self.format_token}, Battle {self.battle.title}, ID {self.id})>'
 
@@ -868,7 +1048,8 @@ class Entry:
         return self.__repr__()
 
 
-@dataclass
+# Slotted: no cached properties on this class need an instance __dict__.
+@dataclass(slots=True)
 class Favorite:
     """A favorite on an entry."""
 
@@ -897,7 +1078,8 @@ class Favorite:
         :returns: The resulting Favorite object.
         """
         ret = unroll_payload(cls, payload)
-        ret._raw_payload = payload.copy()
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -959,6 +1141,16 @@ class GroupID(IntEnum):
     LYCEUM = 14
 
 
+#: Payload-to-attribute rename map for :class:`GroupThread`.
+_GROUP_THREAD_PAYLOAD_TO_ATTR = {
+    "first_post_timestamp": "first_post_timestamp_str",
+    "last_post_timestamp": "last_post_timestamp_str",
+}
+
+
+# Unslotted: the post-timestamp accessors cache per instance through
+# cached_property_dep, which stores into the instance __dict__; their
+# HH:MM:SS timestamps are too unique for a shared parse cache to help.
 @dataclass
 class GroupThread:
     """
@@ -988,9 +1180,7 @@ class GroupThread:
 
         For the raw string, see :attr:`.first_post_timestamp_str`.
         """
-        return datetime.strptime(
-            self.first_post_timestamp_str, "%Y-%m-%d %H:%M:%S"
-        ).replace(tzinfo=pytz.timezone("America/Los_Angeles"))
+        return _to_la_datetime(self.first_post_timestamp_str, "%Y-%m-%d %H:%M:%S")
 
     #: Timestamp of the last post in the thread, in YYYY-MM-DD HH:MM:SS format,
     #: in the US East Coast timezone (same as all other dates on the site).
@@ -1010,9 +1200,7 @@ class GroupThread:
         if self.last_post_timestamp_str is None:
             return None
 
-        return datetime.strptime(
-            self.last_post_timestamp_str, "%Y-%m-%d %H:%M:%S"
-        ).replace(tzinfo=pytz.timezone("America/Los_Angeles"))
+        return _to_la_datetime(self.last_post_timestamp_str, "%Y-%m-%d %H:%M:%S")
 
     #: Raw JSON payload used to create this class. Useful if e.g. you need a raw
     #: value that isn't exposed through the class.
@@ -1029,12 +1217,10 @@ class GroupThread:
         ret = unroll_payload(
             cls,
             payload,
-            payload_to_attr={
-                "first_post_timestamp": "first_post_timestamp_str",
-                "last_post_timestamp": "last_post_timestamp_str",
-            },
+            payload_to_attr=_GROUP_THREAD_PAYLOAD_TO_ATTR,
         )
-        ret._raw_payload = payload.copy()
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -1045,7 +1231,8 @@ class GroupThread:
         return self.__repr__()
 
 
-@dataclass
+# Slotted: no cached properties on this class need an instance __dict__.
+@dataclass(slots=True)
 class LyceumArticle:
     """Represents an article on the Lyceum."""
 
@@ -1095,7 +1282,8 @@ class LyceumArticle:
         return self.__repr__()
 
 
-@dataclass
+# Slotted: no cached properties on this class need an instance __dict__.
+@dataclass(slots=True)
 class Tag:
     """A tag on an entry."""
 
@@ -1120,8 +1308,17 @@ class Tag:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting Favorite object.
         """
-        ret = unroll_payload(cls, payload)
-        ret._raw_payload = payload.copy()
+        # Tags come back by the hundreds from list queries; construct directly
+        # instead of going through unroll_payload's per-field reflection.
+        # Popular tags repeat across thousands of rows; interning dedupes them
+        # and makes tag set/dict lookups identity compares.
+        ret = cls(
+            id=int(payload["id"]),
+            entry_id=int(payload["entry_id"]),
+            tag=sys.intern(payload["tag"]),
+        )
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -1142,7 +1339,7 @@ class Palette:
     #: Title of the palette.
     title: str
 
-    @property
+    @cached_property_dep(attr="id")
     def css_url(self):
         """
         URL to the palette CSS.
@@ -1187,7 +1384,15 @@ class Palette:
         :returns: The resulting Palette object.
         """
         ret = unroll_payload(cls, payload)
-        ret._raw_payload = payload.copy()
+        # Hex colors repeat a lot across palettes (black, white, the default
+        # theme values...); intern them so equal colors share one string.
+        ret.color1 = sys.intern(ret.color1)
+        ret.color2 = sys.intern(ret.color2)
+        ret.color3 = sys.intern(ret.color3)
+        ret.color4 = sys.intern(ret.color4)
+        ret.color5 = sys.intern(ret.color5)
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -1198,7 +1403,17 @@ class Palette:
         return self.__repr__()
 
 
-@dataclass
+#: Payload-to-attribute rename map for :class:`Playlist`.
+_PLAYLIST_PAYLOAD_TO_ATTR = {
+    "date_create": "date_create_str",
+    "date_modify": "date_modify_str",
+}
+
+
+# Slotted: the date accessors below parse date-only strings through the
+# memoized _parse_ymd, so they need no per-instance cache (and thus no
+# instance __dict__).
+@dataclass(slots=True)
 class Playlist:
     """A playlist containing entries."""
 
@@ -1226,7 +1441,7 @@ class Playlist:
     #: see :attr:`.date_create`.
     date_create_str: str
 
-    @cached_property_dep(attr="date_create_str")
+    @property
     def date_create(self) -> datetime:
         """
         Last seen date as a datetime object.
@@ -1234,9 +1449,7 @@ class Playlist:
         For the raw string, see
         :attr:`.date_create_str`.
         """
-        return datetime.strptime(self.date_create_str, "%Y-%m-%d").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.date_create_str, "%Y-%m-%d")
 
     #: String representing the date on which the BotBr was last seen on the site, in
     #: YYYY-MM-DD format, in the US East Coast timezone (same as all other dates on-
@@ -1246,7 +1459,7 @@ class Playlist:
     #: see :attr:`.date_modify`.
     date_modify_str: str = field()
 
-    @cached_property_dep(attr="date_modify_str")
+    @property
     def date_modify(self) -> datetime:
         """
         Last seen date as a datetime object.
@@ -1254,9 +1467,7 @@ class Playlist:
         For the raw string, see
         :attr:`.date_modify_str`.
         """
-        return datetime.strptime(self.date_modify_str, "%Y-%m-%d").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.date_modify_str, "%Y-%m-%d")
 
     #: Description of the playlist.
     description: Optional[str] = None
@@ -1285,12 +1496,10 @@ class Playlist:
         ret = unroll_payload(
             cls,
             payload,
-            payload_to_attr={
-                "date_create": "date_create_str",
-                "date_modify": "date_modify_str",
-            },
+            payload_to_attr=_PLAYLIST_PAYLOAD_TO_ATTR,
         )
-        ret._raw_payload = payload.copy()
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -1301,7 +1510,8 @@ class Playlist:
         return self.__repr__()
 
 
-@dataclass
+# Slotted: no cached properties on this class need an instance __dict__.
+@dataclass(slots=True)
 class PlaylistToEntry:
     """Link between playlist and entry returned by the playlist_to_entry API."""
 
@@ -1332,7 +1542,11 @@ class PlaylistToEntry:
         return self.__repr__()
 
 
-@dataclass
+# Slotted: the date accessor below parses a date-only string through the
+# memoized _parse_ymd, so it needs no per-instance cache (and thus no
+# instance __dict__); these rows are materialized in bulk, making the
+# per-instance saving add up.
+@dataclass(slots=True)
 class DailyStats:
     """
     A single entry in the BotB daily site stats table.
@@ -1352,7 +1566,7 @@ class DailyStats:
     #: see :attr:`.date`.
     date_str: str
 
-    @cached_property_dep(attr="date_str")
+    @property
     def date(self) -> datetime:
         """
         Statistic date as a datetime object.
@@ -1360,9 +1574,7 @@ class DailyStats:
         For the raw string, see
         :attr:`.date_str`.
         """
-        return datetime.strptime(self.date_str, "%Y-%m-%d").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.date_str, "%Y-%m-%d")
 
     #: Total amount of page views.
     page_views: int
@@ -1373,14 +1585,9 @@ class DailyStats:
     #: Total amount of entry downloads (note the deliberate typo).
     donloads: int
 
-    @property
-    def downloads(self) -> int:
-        """Longhand for "donloads", for spelling convenience."""
-        return self.donloads
-
-    @downloads.setter
-    def downloads(self, downloads: int):
-        self.donloads = downloads
+    downloads = _alias_of(
+        "donloads", 'Longhand for "donloads", for spelling convenience.'
+    )
 
     #: Amount of unique IPs visiting the site.
     ip_count: int
@@ -1426,14 +1633,28 @@ class DailyStats:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting DailyStats object.
         """
-        ret = unroll_payload(
-            cls,
-            payload,
-            payload_to_attr={
-                "date": "date_str",
-            },
+        # Stats tables are fetched in bulk (one row per day); construct
+        # directly instead of going through unroll_payload's per-field
+        # reflection.
+        ret = cls(
+            id=int(payload["id"]),
+            date_str=payload["date"],
+            page_views=int(payload["page_views"]),
+            plays=int(payload["plays"]),
+            donloads=int(payload["donloads"]),
+            ip_count=int(payload["ip_count"]),
+            entry_count=int(payload["entry_count"]),
+            botbr_count=int(payload["botbr_count"]),
+            user_count=int(payload["user_count"]),
+            post_count=int(payload["post_count"]),
+            economic_pool=int(payload["economic_pool"]),
+            avg_debit=int(payload["avg_debit"]),
+            bank_debit=int(payload["bank_debit"]),
+            bank_credit=int(payload["bank_credit"]),
+            total_points=int(payload["total_points"]),
         )
-        ret._raw_payload = payload.copy()
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -1444,7 +1665,11 @@ class DailyStats:
         return self.__repr__()
 
 
-@dataclass
+# Slotted: the date accessor below parses a date-only string through the
+# memoized _parse_ymd, so it needs no per-instance cache (and thus no
+# instance __dict__); these rows are materialized in bulk, making the
+# per-instance saving add up.
+@dataclass(slots=True)
 class BotBrStats:
     """
     A single entry in the BotBr stats table.
@@ -1474,7 +1699,7 @@ class BotBrStats:
     #: see :attr:`.date`.
     date_str: str
 
-    @cached_property_dep(attr="date_str")
+    @property
     def date(self) -> datetime:
         """
         Statistic date as a datetime object.
@@ -1482,9 +1707,7 @@ class BotBrStats:
         For the raw string, see
         :attr:`.date_str`.
         """
-        return datetime.strptime(self.date_str, "%Y-%m-%d").replace(
-            tzinfo=pytz.timezone("America/Los_Angeles")
-        )
+        return _to_la_datetime(self.date_str, "%Y-%m-%d")
 
     #: Raw JSON payload used to create this class. Useful if e.g. you need a raw
     #: value that isn't exposed through the class.
@@ -1498,14 +1721,20 @@ class BotBrStats:
         :param payload: Dictionary containing the JSON payload.
         :returns: The resulting BotBrStats object.
         """
-        ret = unroll_payload(
-            cls,
-            payload,
-            payload_to_attr={
-                "date": "date_str",
-            },
+        # The stats endpoints return one row per statistic per day, so this is
+        # the hottest from_payload; construct directly instead of going through
+        # unroll_payload's per-field reflection.
+        # Labels come from a small fixed set ("level", "boons", class names...),
+        # so intern them; equal labels then share one string and compare by
+        # identity.
+        ret = cls(
+            botbr_id=int(payload["botbr_id"]),
+            label=sys.intern(payload["label"]),
+            val=float(payload["val"]),
+            date_str=payload["date"],
         )
-        ret._raw_payload = payload.copy()
+        if _keep_raw_payload:
+            ret._raw_payload = payload
 
         return ret
 
@@ -1514,3 +1743,24 @@ class BotBrStats:
 
     def __str__(self):
         return self.__repr__()
+
+
+# Precompile the unroll_payload plans for every payload dataclass at import
+# time, so that the first from_payload call is as fast as every later one.
+# Tag, DailyStats and BotBrStats construct directly and need no plan.
+for _cls, _map in (
+    (BotBr, _BOTBR_PAYLOAD_TO_ATTR),
+    (BotBrPoints, None),
+    (Format, None),
+    (Battle, _BATTLE_PAYLOAD_TO_ATTR),
+    (EntryAuthor, _ENTRY_AUTHOR_PAYLOAD_TO_ATTR),
+    (Entry, _ENTRY_PAYLOAD_TO_ATTR),
+    (Favorite, None),
+    (GroupThread, _GROUP_THREAD_PAYLOAD_TO_ATTR),
+    (LyceumArticle, None),
+    (Palette, None),
+    (Playlist, _PLAYLIST_PAYLOAD_TO_ATTR),
+    (PlaylistToEntry, None),
+):
+    precompile_plan(_cls, _map)
+del _cls, _map
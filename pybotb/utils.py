@@ -3,11 +3,19 @@
 
 import dataclasses
 from enum import Enum, IntEnum
-from functools import cached_property
+from functools import cached_property, lru_cache
 import requests
 from requests.adapters import HTTPAdapter, Retry
 from typing import Any, Optional, Union, cast
-import time
+
+from . import VERSION
+
+# Optional accelerated JSON decoder (install with the "speed" extra); both
+# accept the raw response bytes directly.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore  # noqa: F401
 
 
 #: Maximum number of retries before we give up.
@@ -18,7 +26,12 @@ REQ_RETRIES = Retry(
     total=MAX_RETRIES,
     connect=MAX_RETRIES,
     read=MAX_RETRIES,
+    status=MAX_RETRIES,
+    # Only GET requests are safe to retry automatically.
+    allowed_methods=frozenset(["GET"]),
     backoff_factor=1,
+    # Jitter decorrelates retry storms across concurrent clients.
+    backoff_jitter=0.5,
     # We do not force retries for 500 errors since multiple
     # parts of the API return them for 404 errors.
     status_forcelist=[502, 503, 504],
@@ -30,66 +43,57 @@ class Session(requests.Session):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.mount("http://", HTTPAdapter(max_retries=REQ_RETRIES))
-        self.mount("https://", HTTPAdapter(max_retries=REQ_RETRIES))
-        self.set_user_agent("pybotb {VERSION}")
+        # A slightly larger pool lets long paged sweeps keep several
+        # keep-alive sockets around instead of reopening connections.
+        self.mount(
+            "http://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=REQ_RETRIES),
+        )
+        self.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=REQ_RETRIES),
+        )
+        self.set_user_agent(f"pybotb {VERSION}")
 
     def get(  # type: ignore
         self,
         url: str,
         *args,
         handle_notfound: bool = False,
-        retry_count: int = 0,
         **kwargs,
     ):
         """
         Get data from an URL.
 
-        Wrapper for self._s.get with better retry handling.
+        Retries with exponential backoff and jitter are handled by the urllib3
+        Retry policy mounted on this session's adapters (see REQ_RETRIES);
+        exhausted retries surface as a ConnectionError.
 
         :param url: URL to access.
         :param handle_notfound: Hack to handle load API returning error 500 on 404.
-        :param retry_count: Current retry count.
+        :raises ConnectionError: When the request fails, retried or not.
         """
-        if retry_count > MAX_RETRIES:
-            raise ConnectionError("Maximum retries reached")
-
-        # Set user agent
-        if "headers" in kwargs:
-            if "User-Agent" not in kwargs["headers"]:
-                kwargs["headers"]["User-Agent"] = self.user_agent
-        else:
-            kwargs["headers"] = {"User-Agent": self.user_agent}
-
         try:
             ret = super().get(url, *args, **kwargs)
-            if ret.status_code == 500 and handle_notfound:
-                json = ret.json()
-                if "unfounded" in json["response_message"]:
-                    ret.status_code = 404
-        except Exception as e:
-            if (retry_count + 1) > MAX_RETRIES:
-                raise ConnectionError("Maximum retries reached") from e
-
-            time.sleep(3)
-
-            return self.get(url, retry_count + 1, **kwargs)
+        except requests.exceptions.RequestException as e:
+            # Not every failure goes through the retry machinery (an invalid
+            # URL or instant DNS error fails outright), so don't claim
+            # retries happened; the cause carries the full detail anyway.
+            raise ConnectionError(f"Request failed: {e}") from e
+
+        if ret.status_code == 500 and handle_notfound:
+            # Substring check on the raw bytes; parsing the whole error
+            # body as JSON just to look at response_message is wasted work.
+            if b"unfounded" in ret.content:
+                ret.status_code = 404
         return ret
 
-    def post(self, *args, **kwargs):  # type: ignore
-        """Make a POST request to an URL; wrapper that fills in user agent."""
-        # Set user agent
-        if "headers" in kwargs:
-            if "User-Agent" not in kwargs["headers"]:
-                kwargs["headers"]["User-Agent"] = self.user_agent
-        else:
-            kwargs["headers"] = {"User-Agent": self.user_agent}
-
-        return super().post(*args, **kwargs)
-
     def set_user_agent(self, user_agent: str):
         """Set the User-Agent header to a specific string."""
         self.user_agent = user_agent
+        # Persisting the header on the session makes requests send it
+        # automatically, with no per-call header dict fixups.
+        self.headers["User-Agent"] = user_agent
 
 
 def payload_cast(in_value: Any, out_type: type) -> Any:
@@ -101,56 +105,119 @@ def payload_cast(in_value: Any, out_type: type) -> Any:
     """
     # Some types can be converted manually; others should be converted
     # by the function callers before calling.
-    try:
-        is_intenum = issubclass(out_type, IntEnum)
-    except TypeError:
-        is_intenum = False
+    caster = _resolve_caster(out_type)
+    if caster is None:
+        # Unknown type, return as-is
+        return in_value
+    return caster(in_value)
 
-    try:
-        is_enum = issubclass(out_type, Enum)
-    except TypeError:
-        is_enum = False
 
-    is_dataclass_with_payload = dataclasses.is_dataclass(out_type)
-    if is_dataclass_with_payload:
-        is_dataclass_with_payload = hasattr(out_type, "from_payload")
+def _cast_bool(val: Any) -> bool:
+    """Cast a payload value (bool, "true"/"false" string, int...) to a bool."""
+    if isinstance(val, bool):
+        return val
+    elif isinstance(val, str):
+        return False if val.lower() == "false" else True
+    return bool(val)
 
-    try:
-        is_typing_list = out_type.__origin__ is list  # type: ignore
-    except AttributeError:
-        is_typing_list = False
 
-    # typing.List type with inner object type defined; cast recursively
-    if is_typing_list:
-        out = []
-        for i in in_value:
-            out.append(payload_cast(i, out_type.__args__[0]))  # type: ignore
-        return out
+@lru_cache(maxsize=None)
+def _resolve_caster(out_type: type) -> Optional[Any]:
+    """
+    Resolve the caster callable for a target type.
+
+    Results are memoized per type, so the issubclass/typing introspection runs
+    once per target type no matter how many values are cast to it.
+
+    Returns None for types that can't be converted manually; their values are
+    passed through as-is (the function callers are expected to convert them).
+
+    :param out_type: Desired output type.
+    :returns: Callable taking the payload value, or None for pass-through.
+    """
+    # Values that already have the target type (e.g. payloads re-hydrated
+    # from a cache rather than fresh JSON) are passed through untouched.
+    if out_type in (int, float):
+        return lambda val, _t=out_type: val if type(val) is _t else _t(val)
+
+    if out_type is str:
+        # str() already returns its argument unchanged for exact strings.
+        return str
+
+    if out_type is bool:
+        return _cast_bool
+
+    if isinstance(out_type, type) and issubclass(out_type, Enum):
+        # IntEnum values need to be converted to int first
+        if issubclass(out_type, IntEnum):
+            return lambda val, _enum=out_type: (
+                val if type(val) is _enum else _enum(int(val))
+            )
+        return lambda val, _enum=out_type: val if type(val) is _enum else _enum(val)
 
     # Data class with from_payload method
-    elif is_dataclass_with_payload:
-        return out_type.from_payload(in_value)  # type: ignore
-
-    # Int, Float, String as well as non-IntEnum Enum types
-    elif out_type in (int, float, str) or (is_enum and not is_intenum):
-        return out_type(in_value)
-
-    # IntEnum (same as above, but convert value to int first)
-    elif is_intenum:
-        return out_type(int(in_value))
-
-    # Boolean
-    elif out_type is bool:
-        val = in_value
-        if type(val) is bool:
-            return val
-        elif type(val) is str:
-            return False if val.lower() == "false" else True
+    if dataclasses.is_dataclass(out_type) and hasattr(out_type, "from_payload"):
+        return out_type.from_payload  # type: ignore
+
+    # typing.List type with inner object type defined; cast recursively
+    if getattr(out_type, "__origin__", None) is list:
+        inner = _resolve_caster(out_type.__args__[0])  # type: ignore
+        if inner is None:
+            return list
+        return lambda val, _inner=inner: [_inner(i) for i in val]
+
+    return None
+
+
+#: Cache of per-class field plans for unroll_payload, keyed by the dataclass
+#: (or by (dataclass, payload_to_attr items) when a rename map is passed).
+_PLANS: dict = {}
+
+#: Sentinel for payload keys that are absent.
+_MISSING = object()
+
+
+def _compile_plan(cls: type, payload_to_attr: Optional[dict]) -> list:
+    """
+    Compile the (payload key, attribute name, caster) plan for a dataclass.
+
+    Resolving the casters once per class here keeps the per-payload hot path in
+    unroll_payload free of issubclass/typing introspection.
+    """
+    attr_to_payload = {}
+    if payload_to_attr:
+        attr_to_payload = dict([(attr, key) for key, attr in payload_to_attr.items()])
+
+    plan = []
+    for field in dataclasses.fields(cls):
+        caster = _resolve_caster(cast(type, field.type))
+        # Renamed attributes accept both the payload name and the attribute
+        # name as keys; the payload name is listed last so that it wins.
+        if field.name in attr_to_payload:
+            plan.append((field.name, field.name, caster))
+            plan.append((attr_to_payload[field.name], field.name, caster))
         else:
-            return bool(val)
+            plan.append((field.name, field.name, caster))
+    return plan
+
+
+def precompile_plan(cls: type, payload_to_attr: Optional[dict] = None):
+    """
+    Compile and cache the unroll_payload plan for a dataclass ahead of time.
+
+    Called at import time for the payload dataclasses so that the first
+    from_payload call is as fast as every later one.
+
+    :param cls: Dataclass to compile the plan for.
+    :param payload_to_attr: Rename map, as passed to :func:`unroll_payload`.
+    """
+    if payload_to_attr is None:
+        plan_key: Any = cls
+    else:
+        plan_key = (cls, tuple(sorted(payload_to_attr.items())))
 
-    # Unknown type, return as-is
-    return in_value
+    if plan_key not in _PLANS:
+        _PLANS[plan_key] = _compile_plan(cls, payload_to_attr)
 
 
 def unroll_payload(
@@ -167,26 +234,31 @@ def unroll_payload(
                             is the name of the target attribute in the class.
     :returns: Instance of `cls` filled with values from the payload.
     """
-    payload_parsed = {}
-    attr_types = dict(
-        [(field.name, cast(type, field.type)) for field in dataclasses.fields(cls)]
-    )
+    if payload_to_attr is None:
+        plan_key: Any = cls
+    else:
+        plan_key = (cls, tuple(sorted(payload_to_attr.items())))
 
-    for payload_attr in payload.keys():
-        if payload_to_attr and payload_attr in payload_to_attr:
-            class_attr = payload_to_attr[payload_attr]
-        else:
-            class_attr = payload_attr
+    plan = _PLANS.get(plan_key)
+    if plan is None:
+        plan = _compile_plan(cls, payload_to_attr)
+        _PLANS[plan_key] = plan
 
-        if class_attr not in attr_types:
+    payload_parsed = {}
+    payload_get = payload.get
+    for payload_attr, class_attr, caster in plan:
+        # A single .get per field; a containment check followed by indexing
+        # would hash every present key twice.
+        value = payload_get(payload_attr, _MISSING)
+        if value is _MISSING:
             continue
 
-        class_attr_type = attr_types[class_attr]
+        if caster is None:
+            payload_parsed[class_attr] = value
+            continue
 
         try:
-            payload_parsed[class_attr] = payload_cast(
-                payload[payload_attr], class_attr_type
-            )
+            payload_parsed[class_attr] = caster(value)
         except Exception as e:
             raise ValueError(
                 f"Failed to convert value of {class_attr} (object ID: {payload.get('id', None)}). This is a pyBotB bug!",
@@ -201,10 +273,6 @@ def unroll_payload(
         ) from e
 
 
-_NOT_FOUND = object()
-_NOT_INITIALIZED = object()
-
-
 class cached_property_dep(cached_property):
     """
     Decorator inspired by cached_property which automatically invalidates the property
@@ -216,10 +284,9 @@ class cached_property_dep(cached_property):
 
     def __init__(self, attr: str = ""):
         self.attrname = None
-        self._attr_cached = _NOT_INITIALIZED
-
+        self.cache_attrname = None
+        self.dep_cache_attrname = None
         self.dep_attrname = attr
-        self._dep_attr_cached = _NOT_INITIALIZED
 
     def __call__(self, func):  # noqa: D102
         self.func = func
@@ -230,6 +297,8 @@ class cached_property_dep(cached_property):
     def __set_name__(self, owner, name):
         if self.attrname is None:
             self.attrname = name
+            self.cache_attrname = f"_{name}_cache"
+            self.dep_cache_attrname = f"_{name}_cache_dep"
         elif name != self.attrname:
             raise TypeError(
                 "Cannot assign the same cached_property to two different names "
@@ -245,31 +314,43 @@ class cached_property_dep(cached_property):
                 "Cannot use cached_property_dep instance without calling __set_name__ on it."
             )
 
-        invalid = False
-
-        # Check if the dependent value changed since we last checked it
         dep_attr_current = getattr(instance, self.dep_attrname)
 
-        if dep_attr_current is not self._dep_attr_cached:
-            del self._dep_attr_cached
-            self._dep_attr_cached = dep_attr_current
-            invalid = True
-
-        val = self._attr_cached
+        # The cached value and the dependent value it was computed from both
+        # live in the instance dict (keyed by the property name); a cache
+        # shared on the descriptor would be recomputed every time accesses to
+        # two instances of the same class interleave. Two flat keys keep the
+        # hit path at two C-level dict lookups, with no tuple wrapper.
+        instance_dict = instance.__dict__
+        try:
+            if instance_dict[self.dep_cache_attrname] is dep_attr_current:
+                return instance_dict[self.cache_attrname]
+        except KeyError:
+            pass
 
-        if invalid or val is _NOT_FOUND:
-            val = self.func(instance)
-            del self._attr_cached
-            self._attr_cached = val
+        val = self.func(instance)
+        instance_dict[self.cache_attrname] = val
+        instance_dict[self.dep_cache_attrname] = dep_attr_current
 
         return val
 
 
+#: Per-type stringifier dispatch for param_stringify; a single dict lookup
+#: on the exact type replaces the per-call type comparison chain.
+_STRINGIFY = {
+    bool: lambda val: "true" if val else "false",
+    int: str,
+    str: str,
+    float: str,
+}
+
+
 def param_stringify(to_stringify: Union[int, str, bool]):
     """
     Take a parameter and stringifies it to a json-like format suitable for dumping
     into urlencode (i.e. no quotes around strings).
     """
-    if type(to_stringify) is bool:
-        return "true" if to_stringify is True else "false"
-    return str(to_stringify)
+    stringify = _STRINGIFY.get(type(to_stringify))
+    if stringify is None:
+        return str(to_stringify)
+    return stringify(to_stringify)
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: MIT
+"""Tests for the client-side Firki markup helpers."""
+
+from pybotb.firki import Firki, FirkiToken
+
+
+def test_firki_token_str():
+    """Test FirkiToken serialization."""
+    assert str(FirkiToken("b")) == "'[b]"
+    assert str(FirkiToken("/b")) == "'[/b]"
+    assert str(FirkiToken("url", ["https://battleofthebits.com"])) == (
+        "'[url:https://battleofthebits.com]"
+    )
+
+
+def test_firki_iter():
+    """Test that iterating over a Firki document is lazy and in order."""
+    firki = Firki("hello '[b]world'[/b]!")
+    it = iter(firki)
+    assert next(it) == "hello "
+    assert next(it) == FirkiToken("b")
+    assert next(it) == "world"
+    assert next(it) == FirkiToken("/b")
+    assert next(it) == "!"
+
+    # Iteration alone does not materialize the markup list
+    assert firki._markup is None
+
+
+def test_firki_markup_memoized():
+    """Test that the markup property is memoized."""
+    firki = Firki("'[b]test'[/b]")
+    markup = firki.markup
+    assert markup == [FirkiToken("b"), "test", FirkiToken("/b")]
+    assert firki.markup is markup
+
+
+def test_firki_roundtrip():
+    """Test that serializing a parsed document returns the source."""
+    source = "a '[url:https://battleofthebits.com]link'[/url] and '[i]more'[/i]"
+    assert str(Firki(source)) == source
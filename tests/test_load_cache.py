@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MIT
+"""Offline tests for the opt-in BotB load cache."""
+
+import json
+
+import pybotb.botb
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response."""
+
+    def __init__(self, status_code: int, payload=None, etag=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+        self.text = self.content.decode()
+        self.headers = {"ETag": etag} if etag is not None else {}
+
+
+class FakeSession:
+    """Stand-in session that serves canned responses and counts requests."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, handle_notfound=False, headers=None):
+        """Serve the next canned response, recording the URL and headers."""
+        self.requests.append((url, headers))
+        return self.responses.pop(0)
+
+    def close(self):
+        """No-op; present so the BotB context manager can close us."""
+
+
+def make_botb(responses, cache_ttl=3600):
+    """Build a BotB object whose session serves the given canned responses."""
+    b = pybotb.botb.BotB(cache_ttl=cache_ttl)
+    b._s = FakeSession(responses)
+    return b
+
+
+def test_load_cache_disabled_by_default():
+    """Test that repeat loads hit the network when caching is off."""
+    payload = {"id": 1, "name": "x"}
+    b = make_botb([FakeResponse(200, payload), FakeResponse(200, payload)], cache_ttl=0)
+    assert b._load("botbr", 1) == payload
+    assert b._load("botbr", 1) == payload
+    assert len(b._s.requests) == 2
+
+
+def test_load_cache_hit_returns_copy():
+    """Test that a fresh cache hit skips the request and returns a copy."""
+    payload = {"id": 1, "name": "x"}
+    b = make_botb([FakeResponse(200, payload)])
+
+    first = b._load("botbr", 1)
+    # Callers may modify the returned dict; the cached copy must not change.
+    first["name"] = "mangled"
+
+    second = b._load("botbr", 1)
+    assert second == payload
+    assert len(b._s.requests) == 1
+
+
+def test_load_cache_expiry_refetches():
+    """Test that an expired entry without an ETag is fetched again."""
+    b = make_botb(
+        [
+            FakeResponse(200, {"id": 1, "name": "x"}),
+            FakeResponse(200, {"id": 1, "name": "y"}),
+        ]
+    )
+    assert b._load("botbr", 1)["name"] == "x"
+
+    # Age the entry past the TTL by hand; monotonic() can't be rewound.
+    t, payload, etag = b._load_cache[("botbr", 1)]
+    b._load_cache[("botbr", 1)] = (t - b.cache_ttl - 1, payload, etag)
+
+    assert b._load("botbr", 1)["name"] == "y"
+    assert len(b._s.requests) == 2
+    # The plain refetch must not send a conditional header.
+    assert b._s.requests[1][1] is None
+
+
+def test_load_cache_etag_revalidation():
+    """Test that an expired entry with an ETag revalidates and accepts a 304."""
+    payload = {"id": 1, "name": "x"}
+    b = make_botb([FakeResponse(200, payload, etag='"v1"'), FakeResponse(304)])
+    assert b._load("botbr", 1) == payload
+
+    t, cached_payload, etag = b._load_cache[("botbr", 1)]
+    b._load_cache[("botbr", 1)] = (t - b.cache_ttl - 1, cached_payload, etag)
+
+    assert b._load("botbr", 1) == payload
+    assert len(b._s.requests) == 2
+    assert b._s.requests[1][1] == {"If-None-Match": '"v1"'}
+
+    # The 304 refreshed the entry; the next load is served without a request.
+    assert b._load("botbr", 1) == payload
+    assert len(b._s.requests) == 2
+
+
+def test_load_cache_404_cached():
+    """Test that a 404 is cached and served as None without a request."""
+    b = make_botb([FakeResponse(404)])
+    assert b._load("botbr", 1) is None
+    assert b._load("botbr", 1) is None
+    assert len(b._s.requests) == 1
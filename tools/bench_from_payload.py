@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: MIT
+"""
+Micro-benchmark for the payload-parsing hot paths.
+
+Runs entirely offline against synthetic payloads. A warmup pass is done before
+measuring so that JIT interpreters (PyPy) are benchmarked at steady state; set
+PYBOTB_PURE_PYTHON=1 to also skip optional C accelerators like ciso8601.
+"""
+
+import timeit
+
+from pybotb.types import BotBr, BotBrStats, Tag
+
+BOTBR_PAYLOAD = {
+    "id": "16333",
+    "name": "uart",
+    "boons": "12.5",
+    "profile_url": "https://battleofthebits.com/barracks/Profile/uart/",
+    "avatar_url": "https://battleofthebits.com/disk/botbr_avatars/x.png",
+    "aura": "00016333",
+    "aura_color": "112233",
+    "badge_levels": {"mixist": 1, "chipist": 3},
+    "class": "mixist",
+    "class_icon": "mixist.png",
+    "create_date": "2020-01-02",
+    "laston_date": "2024-03-04",
+    "level": "13",
+    "palette_id": "1",
+    "points": "100",
+    "points_array": {"mixist": "50", "codist": "25"},
+}
+
+BOTBR_STATS_PAYLOAD = {
+    "botbr_id": "16333",
+    "label": "level",
+    "val": "13.0",
+    "date": "2024-01-05",
+}
+
+TAG_PAYLOAD = {"id": "5", "entry_id": "77", "tag": "chipmusic"}
+
+BENCHMARKS = (
+    ("BotBr.from_payload", lambda: BotBr.from_payload(BOTBR_PAYLOAD)),
+    ("BotBr dates", lambda: BotBr.from_payload(BOTBR_PAYLOAD).create_date),
+    ("BotBrStats.from_payload", lambda: BotBrStats.from_payload(BOTBR_STATS_PAYLOAD)),
+    ("Tag.from_payload", lambda: Tag.from_payload(TAG_PAYLOAD)),
+)
+
+if __name__ == "__main__":
+    for name, func in BENCHMARKS:
+        # Warmup, excluded from measurement
+        for _ in range(2000):
+            func()
+
+        number = 10000
+        best = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"{name}: {best * 1_000_000:.2f} us/call")
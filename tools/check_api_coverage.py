@@ -4,14 +4,24 @@ Script that parses pyBotB docstrings and compares the supported endpoints agains
 ones reported by the documentation index.
 """
 
+from functools import lru_cache
 import pybotb.botb
-import requests
+from pybotb.utils import Session
 from typing import Optional
 import re
 
 #: Base URL of the API.
 API_BASE = "/api/v1/"
 
+#: Matches the ":api: /api/v1/..." marker in a docstring.
+_API_RE = re.compile(r"^\s*:api:\s*(\S+)", re.M)
+
+#: Matches positions before uppercase letters in PascalCase names.
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+#: Shared session; gets keep-alive and the package's retry handling for free.
+_session = Session()
+
 
 def get_documentation_index() -> dict:
     """
@@ -21,7 +31,7 @@ def get_documentation_index() -> dict:
     :raises ConnectionError: On connection error.
     """
     try:
-        ret = requests.get(
+        ret = _session.get(
             "https://battleofthebits.com" + API_BASE + "documentation/index"
         )
     except Exception as e:
@@ -33,7 +43,8 @@ def get_documentation_index() -> dict:
     return ret.json()
 
 
-def get_api_endpoint_from_docstring(docstring: str) -> Optional[str]:
+@lru_cache(maxsize=None)
+def get_api_endpoint_from_docstring(docstring: Optional[str]) -> Optional[str]:
     """
     Retrieve the API endpoint from the docstring.
 
@@ -41,19 +52,21 @@ def get_api_endpoint_from_docstring(docstring: str) -> Optional[str]:
     :returns: String containing the API endpoint, or None if the endpoint is not
         provided.
     """
-    endpoint = None
+    if not docstring:
+        return None
 
     # Adding an endpoint to the docstring is done by adding the following:
     #
     #   :api: /api/v1/...
     #
-    # to the docstring.
-    for line in docstring.split("\n"):
-        if line.strip().startswith(":api:"):
-            endpoint = line.split(":api:")[1].strip()
-            break
+    # to the docstring. A single compiled regex scan avoids splitting the
+    # docstring into a line list, and the lru_cache makes repeat lookups
+    # (shared docstrings, multiple passes) free.
+    match = _API_RE.search(docstring)
+    if match is None:
+        return None
 
-    return endpoint
+    return match.group(1)
 
 
 #: Ignored endpoints, with reasons.
@@ -73,72 +86,87 @@ IGNORED_ENDPOINTS = [
 
 #: Ignored object type properties, with reasons.
 IGNORED_PROPERTIES = {
-    "BotBr": [
-        "class",  # Renamed to botbr_class to avoid collision with Python class keyword
-    ],
-    "BotBrStats": [
-        "date",
-        "date_str",
-    ],
-    "DailyStats": [
-        "date",
-        "date_str",
-    ],
-    "Battle": [
-        # Upstream:
-        "profileURL",  # Redundant, see url
-        "end",  # Renamed to end_str, end attr is a datetime object
-        "end_date",  # Redundant
-        "end_time_left",  # Redundant
-        "period_end",  # Renamed to period_end_str, period_end attr is a datetime object
-        "period_end_date",  # Redundant
-        "period_end_seconds",  # Redundant
-        "period_end_time_left",  # Redundant
-        "start",  # Renamed to start_str
-        "disable_penalty",  # Listed in the docs, but not actually returned by the API
-        #: pyBotB overrides:
-        "end_str",
-        "start_str",
-        "period_end_str",
-    ],
-    "Entry": [
-        # Upstream:
-        "datetime",  # Renamed to datetime_str, datetime is a datetime object
-        "medium_audio",  # Collapsed into medium attr
-        "medium_visual",  # Collapsed into medium attr
-        "medium_other",  # Collapsed into medium attr
-        # These are added into the API query result, but not listed as properties
-        # in the documentation:
-        "battle",
-        "botbr",
-        "format",
-        # pyBotB overrides:
-        "datetime_str",
-        "medium",
-    ],
-    "GroupThread": [
-        # Upstream:
-        "first_post_timestamp",  # Renamed to first_post_timestamp_str, first_post_timestamp is a datetime object
-        "last_post_timestamp",  # Renamed to last_post_timestamp_str, last_post_timestamp is a datetime object
-        # pyBotB overrides:
-        "first_post_timestamp_str",
-        "last_post_timestamp_str",
-    ],
-    "Playlist": [
-        # Upstream:
-        "date_create",  # Renamed to date_create_str, date_create is a datetime object
-        "date_modify",  # Renamed to date_modify_str, date_modify is a datetime object
-        # pyBotB overrides:
-        "date_create_str",
-        "date_modify_str",
-    ],
+    "BotBr": frozenset(
+        {
+            "class",  # Renamed to botbr_class to avoid collision with Python class keyword
+        }
+    ),
+    "BotBrStats": frozenset(
+        {
+            "date",
+            "date_str",
+        }
+    ),
+    "DailyStats": frozenset(
+        {
+            "date",
+            "date_str",
+        }
+    ),
+    "Battle": frozenset(
+        {
+            # Upstream:
+            "profileURL",  # Redundant, see url
+            "end",  # Renamed to end_str, end attr is a datetime object
+            "end_date",  # Redundant
+            "end_time_left",  # Redundant
+            "period_end",  # Renamed to period_end_str, period_end attr is a datetime object
+            "period_end_date",  # Redundant
+            "period_end_seconds",  # Redundant
+            "period_end_time_left",  # Redundant
+            "start",  # Renamed to start_str
+            "disable_penalty",  # Listed in the docs, but not actually returned by the API
+            #: pyBotB overrides:
+            "end_str",
+            "start_str",
+            "period_end_str",
+        }
+    ),
+    "Entry": frozenset(
+        {
+            # Upstream:
+            "datetime",  # Renamed to datetime_str, datetime is a datetime object
+            "medium_audio",  # Collapsed into medium attr
+            "medium_visual",  # Collapsed into medium attr
+            "medium_other",  # Collapsed into medium attr
+            # These are added into the API query result, but not listed as properties
+            # in the documentation:
+            "battle",
+            "botbr",
+            "format",
+            # pyBotB overrides:
+            "datetime_str",
+            "medium",
+        }
+    ),
+    "GroupThread": frozenset(
+        {
+            # Upstream:
+            "first_post_timestamp",  # Renamed to first_post_timestamp_str, first_post_timestamp is a datetime object
+            "last_post_timestamp",  # Renamed to last_post_timestamp_str, last_post_timestamp is a datetime object
+            # pyBotB overrides:
+            "first_post_timestamp_str",
+            "last_post_timestamp_str",
+        }
+    ),
+    "Playlist": frozenset(
+        {
+            # Upstream:
+            "date_create",  # Renamed to date_create_str, date_create is a datetime object
+            "date_modify",  # Renamed to date_modify_str, date_modify is a datetime object
+            # pyBotB overrides:
+            "date_create_str",
+            "date_modify_str",
+        }
+    ),
 }
 
 
+@lru_cache(maxsize=None)
 def dataclass_name_to_object_type(dataclass_name: str):
     """Convert a name from PascalCase (class name) to snake_case (object type name)."""
     # https://stackoverflow.com/questions/1175208/elegant-python-function-to-convert-camelcase-to-snake-case#1176023
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", dataclass_name).lower()
+    return _CAMEL_RE.sub("_", dataclass_name).lower()
 
 
 if __name__ == "__main__":
@@ -163,15 +191,23 @@ if __name__ == "__main__":
         if endpoint:
             pybotb_endpoints.append(endpoint)
 
+    # Sets make the diff O(n+m) instead of O(n*m) list scans.
+    endpoints_set = set(endpoints)
+    pybotb_endpoints_set = set(pybotb_endpoints)
+    ignored_endpoints_set = set(IGNORED_ENDPOINTS)
+
     missing = 0
     for endpoint in endpoints:
-        if endpoint not in pybotb_endpoints and endpoint not in IGNORED_ENDPOINTS:
+        if (
+            endpoint not in pybotb_endpoints_set
+            and endpoint not in ignored_endpoints_set
+        ):
             print(f"Missing endpoint: {endpoint}")
             missing += 1
 
     not_upstream = 0
     for endpoint in pybotb_endpoints:
-        if endpoint not in endpoints:
+        if endpoint not in endpoints_set:
             print(f"Endpoint not in upstream documentation: {endpoint}")
             not_upstream += 1
 
@@ -182,36 +218,35 @@ if __name__ == "__main__":
     not_upstream_props_ignored = 0
 
     for dataclass_name in dir(pybotb.botb):
-        dataclass_props = []
         object_type = dataclass_name_to_object_type(dataclass_name)
         if object_type not in doc_index:
             continue
 
         object_props = doc_index[object_type]["properties"]
+        object_props_set = set(object_props)
         dataclass = getattr(pybotb.botb, dataclass_name)
+        ignored_props = IGNORED_PROPERTIES.get(dataclass_name, frozenset())
 
-        for prop in dataclass.__dataclass_fields__:
-            if prop.startswith("_"):
-                continue
-            dataclass_props.append(prop)
+        dataclass_props = [
+            prop for prop in dataclass.__dataclass_fields__ if not prop.startswith("_")
+        ]
+        dataclass_props_set = set(dataclass_props)
 
         for prop in object_props:
-            if prop in IGNORED_PROPERTIES.get(dataclass_name, []):
+            if prop in ignored_props:
                 missing_props_ignored += 1
                 continue
 
-            if prop not in dataclass_props:
+            if prop not in dataclass_props_set:
                 print(f"Missing property: {dataclass_name}.{prop}")
                 missing_props += 1
 
         for prop in dataclass_props:
-            if prop in IGNORED_PROPERTIES.get(dataclass_name, []):
+            if prop in ignored_props:
                 not_upstream_props_ignored += 1
                 continue
 
-            if prop not in object_props and prop not in IGNORED_PROPERTIES.get(
-                dataclass_name, []
-            ):
+            if prop not in object_props_set:
                 print(
                     f"Property not in upstream documentation: {dataclass_name}.{prop}"
                 )
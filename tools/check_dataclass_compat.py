@@ -15,6 +15,10 @@ b = BotB()
 for object_type in ("palette",):
     print(f"Testing {object_type}...")
     list_func = getattr(b, object_type + "_list")
-    b.list_iterate_over_pages(list_func, sort="id")
+    # The list methods return a lazy PaginatedList; draining it parses every
+    # object through from_payload, which is what this check is after. The
+    # session keeps the connection alive across the page fetches.
+    for _obj in list_func(sort="id"):
+        pass
 
 print("Completed succesfully!")
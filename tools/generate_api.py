@@ -1,27 +1,64 @@
 # SPDX-License-Identifier: MIT
 """Auto-generate API methods for the given object types."""
 
-import requests
+import json
+import os
+import time
+
+from pybotb.utils import Session
+
+#: Shared session; gets keep-alive and the package's retry handling for free.
+_session = Session()
+
+#: On-disk cache for the documentation index; the index only changes when
+#: the site API does, so generator re-runs within a day skip the fetch.
+_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "pybotb",
+    "doc_index.json",
+)
+
+#: How long the cached documentation index stays fresh, in seconds.
+_CACHE_TTL = 86400
 
 
 def get_documentation_index() -> dict:
     """
     Get the BotB documentation index for further parsing.
 
+    The index is cached on disk for a day; delete the cache file to force a
+    refetch.
+
     :returns: Dictionary containing the documentation index.
     :raises ConnectionError: On connection error.
     """
     try:
-        ret = requests.get(
-            "https://battleofthebits.com/api/v1/documentation/index"
-        )
+        if time.time() - os.path.getmtime(_CACHE_PATH) < _CACHE_TTL:
+            with open(_CACHE_PATH) as cache_file:
+                return json.load(cache_file)
+    except (OSError, ValueError):
+        # Missing, expired or unreadable cache; fall through to the fetch.
+        pass
+
+    try:
+        ret = _session.get("https://battleofthebits.com/api/v1/documentation/index")
     except Exception as e:
         raise ConnectionError from e
 
     if ret.status_code != 200:
         raise ConnectionError
 
-    return ret.json()
+    index = ret.json()
+
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(_CACHE_PATH, "w") as cache_file:
+            json.dump(index, cache_file)
+    except OSError:
+        # A read-only cache dir shouldn't break the generator.
+        pass
+
+    return index
 
 
 OBJECT_TYPES = [
@@ -30,13 +67,29 @@ OBJECT_TYPES = [
     {"name": "entry", "object_type": "entry", "dataclass_name": "Entry"},
     {"name": "favorite", "object_type": "favorite", "dataclass_name": "Favorite"},
     {"name": "format", "object_type": "format", "dataclass_name": "Format"},
-    {"name": "group thread", "object_type": "group_thread", "dataclass_name": "GroupThread"},
-    {"name": "lyceum article", "object_type": "lyceum_article", "dataclass_name": "LyceumArticle"},
+    {
+        "name": "group thread",
+        "object_type": "group_thread",
+        "dataclass_name": "GroupThread",
+    },
+    {
+        "name": "lyceum article",
+        "object_type": "lyceum_article",
+        "dataclass_name": "LyceumArticle",
+    },
     {"name": "palette", "object_type": "palette", "dataclass_name": "Palette"},
     {"name": "playlist", "object_type": "playlist", "dataclass_name": "Playlist"},
     {"name": "tag", "object_type": "tag", "dataclass_name": "Tag"},
-    {"name": "BotBr stat", "object_type": "botbr_stats", "dataclass_name": "BotBrStats"},
-    {"name": "daily stat", "object_type": "daily_stats", "dataclass_name": "DailyStats"},
+    {
+        "name": "BotBr stat",
+        "object_type": "botbr_stats",
+        "dataclass_name": "BotBrStats",
+    },
+    {
+        "name": "daily stat",
+        "object_type": "daily_stats",
+        "dataclass_name": "DailyStats",
+    },
 ]
 
 TEMPLATE_LOAD = """
@@ -94,11 +147,8 @@ TEMPLATE_LIST = """
             conditions=conditions,
         )
 
-        out = []
-        for payload in ret:
-            out.append({dataclass_name}.from_payload(payload))
-
-        return out
+        from_payload = {dataclass_name}.from_payload
+        return [from_payload(payload) for payload in ret]
 
     def {object_type}_list(
         self,
@@ -169,11 +219,8 @@ TEMPLATE_SEARCH = """
             "{object_type}", query, page_number=page_number, page_length=page_length
         )
 
-        out = []
-        for payload in ret:
-            out.append({dataclass_name}.from_payload(payload))
-
-        return out
+        from_payload = {dataclass_name}.from_payload
+        return [from_payload(payload) for payload in ret]
 
     def {object_type}_search(self, query: str, max_items: int = 0) -> Iterable[{dataclass_name}]:
         \"\"\"
@@ -193,24 +240,40 @@ TEMPLATE_SEARCH = """
 """
 
 
-def fill_template(template: str, obj: dict):
-    """Fill template with object data."""
-    return template.replace("{object_type}", obj["object_type"]).replace("{name}", obj["name"]).replace("{dataclass_name}", obj["dataclass_name"])
+#: Templates by the command name the documentation index reports for them.
+TEMPLATES = {
+    "load": TEMPLATE_LOAD,
+    "list": TEMPLATE_LIST,
+    "random": TEMPLATE_RANDOM,
+    "search": TEMPLATE_SEARCH,
+}
+
+#: Every template pre-filled for every object type. OBJECT_TYPES is static,
+#: so this is done once at import; the main block only filters the blocks by
+#: the commands the documentation index reports, making runs deterministic.
+PRECOMPILED = tuple(
+    (
+        obj,
+        {command: template.format_map(obj) for command, template in TEMPLATES.items()},
+    )
+    for obj in OBJECT_TYPES
+)
 
 
 if __name__ == "__main__":
     doc = get_documentation_index()
 
-    for obj in OBJECT_TYPES:
+    for obj, blocks in PRECOMPILED:
         print(f"""
     #
     # {obj["name"].capitalize().replace("Botbr", "BotBr")}s
     #""")
-        if "load" in doc[obj["object_type"]]["commands"] and obj["object_type"] not in ["botbr_stats"]:
-            print(fill_template(TEMPLATE_LOAD, obj))
-        if "list" in doc[obj["object_type"]]["commands"]:
-            print(fill_template(TEMPLATE_LIST, obj))
-        if "random" in doc[obj["object_type"]]["commands"]:
-            print(fill_template(TEMPLATE_RANDOM, obj))
-        if "search" in doc[obj["object_type"]]["commands"]:
-            print(fill_template(TEMPLATE_SEARCH, obj))
+        commands = doc[obj["object_type"]]["commands"]
+        if "load" in commands and obj["object_type"] not in ["botbr_stats"]:
+            print(blocks["load"])
+        if "list" in commands:
+            print(blocks["list"])
+        if "random" in commands:
+            print(blocks["random"])
+        if "search" in commands:
+            print(blocks["search"])